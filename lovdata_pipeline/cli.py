@@ -56,6 +56,12 @@ def process(
         "-l",
         help="Limit number of files to process (for testing)",
     ),
+    workers: int = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Number of files processed concurrently (default: 1)",
+    ),
 ):  # pylint: disable=too-many-arguments
     """Process all documents: sync → chunk → embed → index.
 
@@ -82,6 +88,9 @@ def process(
 
         # Force reprocess everything
         lovdata-pipeline process --force
+
+        # Overlap embedding requests across 4 files at a time
+        lovdata-pipeline process --workers 4
     """
     try:
         # Load settings from environment with CLI overrides
@@ -102,6 +111,8 @@ def process(
             settings_kwargs["storage_type"] = storage
         if limit is not None:
             settings_kwargs["limit"] = limit
+        if workers is not None:
+            settings_kwargs["max_workers"] = workers
 
         # Load and validate settings
         settings = PipelineSettings(**settings_kwargs)
@@ -128,7 +139,7 @@ def process(
         console.print()  # Add blank line before progress bars
 
         # Create orchestrator
-        orchestrator = PipelineOrchestrator.create(
+        with PipelineOrchestrator.create(
             openai_api_key=settings.openai_api_key,
             embedding_model=settings.embedding_model,
             chunk_max_tokens=settings.chunk_max_tokens,
@@ -139,19 +150,25 @@ def process(
             chunk_min_tokens=settings.chunk_min_tokens,
             chunk_overlap_ratio=settings.chunk_overlap_ratio,
             embedding_dimensions=settings.embedding_dimensions,
-        )
-
-        # Create pipeline config
-        pipeline_config = PipelineConfig(
-            data_dir=settings.data_dir,
-            dataset_filter=settings.dataset_filter,
-            force=settings.force,
-            limit=settings.limit,
-        )
+            jsonl_compress=settings.jsonl_compress,
+            chroma_upsert_batch_size=settings.chroma_upsert_batch_size,
+            max_workers=settings.max_workers,
+            files_per_batch=settings.files_per_batch,
+            embedding_concurrency=settings.embedding_concurrency,
+            embedding_cache=settings.embedding_cache,
+            chunk_processes=settings.chunk_processes,
+        ) as orchestrator:
+            # Create pipeline config
+            pipeline_config = PipelineConfig(
+                data_dir=settings.data_dir,
+                dataset_filter=settings.dataset_filter,
+                force=settings.force,
+                limit=settings.limit,
+            )
 
-        # Run pipeline with progress tracking
-        progress_tracker = RichProgressTracker(console=console)
-        result = orchestrator.run(pipeline_config, progress_tracker)
+            # Run pipeline with progress tracking
+            progress_tracker = RichProgressTracker(console=console)
+            result = orchestrator.run(pipeline_config, progress_tracker)
 
         # Exit with failure code if any failed
         if result.failed > 0:
@@ -184,8 +201,6 @@ def migrate(
         lovdata-pipeline migrate -s chroma -t jsonl --jsonl-path ./backup
     """
     try:
-        from pathlib import Path
-
         # Validate storage types
         if source not in ["chroma", "jsonl"]:
             console.print(f"[red]Invalid source storage: {source}[/red]")
@@ -310,15 +325,12 @@ def migrate(
             )
             target_store = ChromaVectorStoreRepository(collection)
 
-            # Migrate each hash file
+            # Stream chunks in batches so memory stays bounded by batch_size
             migrated = 0
-            hashes = source_store.list_hashes()
-
-            for hash_val in hashes:
-                chunks = source_store.get_chunks_by_hash(hash_val)
+            for chunks in source_store.iter_chunks(batch_size):
                 target_store.upsert_chunks(chunks)
                 migrated += len(chunks)
-                console.print(f"Migrated {migrated}/{total_chunks} chunks from {hash_val}.jsonl...")
+                console.print(f"Migrated {migrated}/{total_chunks} chunks...")
 
         console.print()
         console.print("[green]✓ Migration complete![/green]")
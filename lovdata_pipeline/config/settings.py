@@ -55,6 +55,16 @@ class PipelineSettings(BaseSettings):
         default="chroma",
         description="Vector storage type: 'chroma' or 'jsonl'",
     )
+    jsonl_compress: bool = Field(
+        default=False,
+        description="Gzip-compress JSONL chunk files (for network or space-bound storage)",
+    )
+    chroma_upsert_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=5461,
+        description="Vectors per ChromaDB upsert call (5461 = Chroma's default max batch)",
+    )
 
     # Pipeline Configuration
     data_dir: Path = Field(
@@ -103,6 +113,34 @@ class PipelineSettings(BaseSettings):
         default=None,
         description="Limit number of files to process (for testing)",
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Files processed concurrently (embedding calls are network-bound)",
+    )
+    files_per_batch: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Files whose chunks share embedding requests (helps many small files)",
+    )
+    embedding_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Embedding batches in flight at once per file (helps large documents)",
+    )
+    embedding_cache: bool = Field(
+        default=False,
+        description="Cache embeddings on disk by chunk text so re-runs skip the API",
+    )
+    chunk_processes: int = Field(
+        default=0,
+        ge=0,
+        le=32,
+        description="Worker processes for XML chunking (0 = chunk in the main process)",
+    )
 
     @field_validator("data_dir", "chroma_path", mode="before")
     @classmethod
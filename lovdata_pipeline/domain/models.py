@@ -1,9 +1,14 @@
 """Domain models for Lovdata pipeline.
 
 These are pure Python data structures with no Dagster dependencies.
-Uses Pydantic for validation, serialization, and type safety.
+Uses Pydantic for validation, serialization, and type safety. High-volume
+internal records (one per file, tracked document or raw chunk) are slotted
+dataclasses instead, since they are built from trusted data and never
+serialized via Pydantic.
 """
 
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
@@ -137,15 +142,18 @@ class EnrichedChunk(ChunkMetadata):
 # ============================================================================
 
 
-class Chunk(BaseModel):
-    """Minimal chunk representation from chunker."""
+@dataclass(slots=True)
+class Chunk:
+    """Minimal chunk representation from chunker.
 
-    chunk_id: str = Field(description="Unique identifier for this chunk")
-    text: str = Field(description="Text content of the chunk")
-    token_count: int = Field(ge=0, description="Number of tokens in the text")
-    metadata: dict[str, Any] = Field(
-        default_factory=dict, description="Structural/hierarchical info"
-    )
+    Intermediate output only: ChunkingService converts each one into a
+    validated ChunkMetadata, so it skips Pydantic validation on creation.
+    """
+
+    chunk_id: str  # Unique identifier for this chunk
+    text: str  # Text content of the chunk
+    token_count: int  # Number of tokens in the text
+    metadata: dict[str, Any] = field(default_factory=dict)  # Structural/hierarchical info
 
 
 # ============================================================================
@@ -153,15 +161,14 @@ class Chunk(BaseModel):
 # ============================================================================
 
 
-class FileInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FileInfo:
     """Information about a file to process."""
 
-    doc_id: str = Field(description="Document identifier")
-    path: Path = Field(description="Path to the file")
-    dataset: str = Field(description="Dataset name")
-    hash: str = Field(description="SHA256 hash of file")
-
-    model_config = {"arbitrary_types_allowed": True}
+    doc_id: str  # Document identifier
+    path: Path  # Path to the file
+    dataset: str  # Dataset name
+    hash: str  # SHA256 hash of file
 
 
 class FileProcessingResult(BaseModel):
@@ -203,22 +210,17 @@ class PipelineResult(BaseModel):
 # ============================================================================
 
 
-class LovligFileInfo(BaseModel):
-    """Information about a file from lovlig state."""
-
-    doc_id: str = Field(description="Document identifier")
-    path: Path = Field(description="Absolute path to file")
-    hash: str = Field(description="SHA256 hash of file")
-    dataset: str = Field(description="Dataset name")
+# Lovlig yields FileInfo records directly so the orchestrator can pass them on
+# without copying; the alias keeps the integration-facing name.
+LovligFileInfo = FileInfo
 
-    model_config = {"arbitrary_types_allowed": True}
 
-
-class LovligRemovedFileInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LovligRemovedFileInfo:
     """Information about a removed file from lovlig state."""
 
-    doc_id: str = Field(description="Document identifier")
-    dataset: str = Field(description="Dataset name")
+    doc_id: str  # Document identifier
+    dataset: str  # Dataset name
 
 
 class LovligSyncStats(BaseModel):
@@ -229,24 +231,59 @@ class LovligSyncStats(BaseModel):
     removed: int = Field(ge=0, description="Number of files removed")
 
 
+@dataclass(slots=True, frozen=True)
+class FileScanSnapshot:
+    """Result of one pass over lovlig's state.json, shared by all file queries."""
+
+    stats: LovligSyncStats  # Counts of added, modified and removed files
+    changed: list[LovligFileInfo]  # Files with status 'added' or 'modified'
+    removed: list[LovligRemovedFileInfo]  # Files with status 'removed'
+    all_files: list[LovligFileInfo]  # All non-removed files
+
+
 # ============================================================================
 # State Management Models
 # ============================================================================
 
 
-class ProcessedDocumentInfo(BaseModel):
-    """Information about a successfully processed document."""
+@dataclass(slots=True)
+class ProcessedDocumentInfo:
+    """Information about a successfully processed document.
+
+    A slotted dataclass rather than a BaseModel: one instance is held per
+    tracked document, and entries are only built from our own state files.
+    """
+
+    hash: str  # SHA256 hash of document
+    # When processed: nanoseconds since the epoch for new entries, or the ISO
+    # string exactly as read from the snapshot (kept verbatim for the next save)
+    at: int | str
 
-    hash: str = Field(description="SHA256 hash of document")
-    at: str = Field(description="ISO timestamp when processed")
+    @property
+    def at_iso(self) -> str:
+        """ISO timestamp when processed (formatted on demand)."""
+        return _ns_to_iso(self.at)
 
 
-class FailedDocumentInfo(BaseModel):
+@dataclass(slots=True)
+class FailedDocumentInfo:
     """Information about a failed document."""
 
-    hash: str = Field(description="SHA256 hash of document")
-    error: str = Field(description="Error message")
-    at: str = Field(description="ISO timestamp when failed")
+    hash: str  # SHA256 hash of document
+    error: str  # Error message
+    at: int | str  # When failed, as for ProcessedDocumentInfo.at
+
+    @property
+    def at_iso(self) -> str:
+        """ISO timestamp when failed (formatted on demand)."""
+        return _ns_to_iso(self.at)
+
+
+def _ns_to_iso(at: int | str) -> str:
+    """Format a nanosecond timestamp as ISO, passing snapshot strings through."""
+    if isinstance(at, str):
+        return at
+    return datetime.fromtimestamp(at / 1e9, UTC).isoformat()
 
 
 class ProcessingStateData(BaseModel):
@@ -17,15 +17,43 @@ Key Parameters:
 
 import logging
 import re
+import threading
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 
-import tiktoken
 from lxml import etree
 
 from lovdata_pipeline.domain.models import Chunk
+from lovdata_pipeline.domain.splitters.token_counter import count_tokens, get_encoding
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: element.xpath() would parse and compile the expression on
+# every call, and these run once per document, section or paragraph
+_LEGAL_ARTICLES = etree.XPath('//article[@class="legalArticle"]')
+_SECTIONS = etree.XPath('//section[@class="section"]')
+_DESCENDANT_LEGAL_P = etree.XPath('.//article[@class="legalP"]')
+_CHILD_LEGAL_P = etree.XPath('./article[@class="legalP"]')
+
+# One parser per thread (lxml parsers must not be shared between threads),
+# reused across documents instead of set up per parse. IDs are never looked
+# up, so libxml2's id index is not built. Blank text is kept: whitespace-only
+# tails separate inline elements in the extracted text.
+_parsers = threading.local()
+
+
+def _get_parser() -> etree.XMLParser:
+    """Get this thread's XML parser."""
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = etree.XMLParser(collect_ids=False)
+    return parser
+
+
+# Sentence boundary: whitespace after terminal punctuation (Norwegian-aware)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 class LovdataChunker:
     """Three-tier fallback chunking strategy for Lovdata XML documents.
@@ -50,7 +78,7 @@ class LovdataChunker:
             min_tokens: Minimum tokens to avoid tiny chunks (reduces storage overhead)
             overlap_ratio: Ratio of overlap between chunks (0.0-1.0)
         """
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = get_encoding("cl100k_base")
         self.target = target_tokens
         self.max = max_tokens
         self.min = min_tokens
@@ -65,8 +93,11 @@ class LovdataChunker:
         Returns:
             List of Chunk objects
         """
-        tree = etree.parse(str(xml_path))
-        root = tree.getroot()
+        # Read the file in one call and parse from memory; for documents of a
+        # few MB this beats libxml2's own small-buffer file reads
+        with open(xml_path, "rb") as f:
+            data = f.read()
+        root = etree.fromstring(data, _get_parser(), base_url=str(xml_path))
 
         # Tier 1: Standard laws (paragraphs with ledd)
         chunks = self._chunk_standard(root)
@@ -93,15 +124,19 @@ class LovdataChunker:
             List of chunks
         """
         chunks = []
+        # Looked up once: finding the h1 scans the whole tree
+        doc_title = None
+        section_headings: dict = {}
 
         # Find all paragraphs (§)
-        for article in root.xpath('//article[@class="legalArticle"]'):
-            paragraph_ref = self._get_paragraph_ref(article)
-            paragraph_title = self._get_paragraph_title(article)
-            context = self._get_hierarchical_context(article, root)
+        for article in _LEGAL_ARTICLES(root):
+            if doc_title is None:
+                doc_title = self._get_document_title(root)
+            paragraph_ref, paragraph_title = self._get_paragraph_header(article)
+            context = self._get_hierarchical_context(article, doc_title, section_headings)
 
             # Extract all ledd within this paragraph
-            for idx, ledd in enumerate(article.xpath('.//article[@class="legalP"]'), 1):
+            for idx, ledd in enumerate(_DESCENDANT_LEGAL_P(article), 1):
                 text = self._extract_ledd_text(ledd)
                 tokens = self._count_tokens(text)
 
@@ -150,13 +185,20 @@ class LovdataChunker:
             List of chunks
         """
         chunks = []
-
-        for section in root.xpath('//section[@class="section"]'):
-            section_heading = self._get_section_heading(section)
-            context = self._get_hierarchical_context(section, root)
+        # Looked up once: finding the h1 scans the whole tree
+        doc_title = None
+        section_headings: dict = {}
+
+        for section in _SECTIONS(root):
+            if doc_title is None:
+                doc_title = self._get_document_title(root)
+            # Enclosing sections come first in document order, so nested
+            # sections find their parents' headings in the cache
+            section_heading = self._get_cached_section_heading(section, section_headings)
+            context = self._get_hierarchical_context(section, doc_title, section_headings)
 
             # Group legalP elements
-            legalp_list = section.xpath('.//article[@class="legalP"]')
+            legalp_list = _DESCENDANT_LEGAL_P(section)
             if not legalp_list:
                 continue
 
@@ -210,7 +252,7 @@ class LovdataChunker:
 
         doc_title = self._get_document_title(root)
 
-        for idx, legalp in enumerate(main.xpath('./article[@class="legalP"]'), 1):
+        for idx, legalp in enumerate(_CHILD_LEGAL_P(main), 1):
             text = self._extract_text(legalp)
             tokens = self._count_tokens(text)
 
@@ -264,11 +306,11 @@ class LovdataChunker:
 
             elif child.tag == "p" and "leddfortsettelse" in child.get("class", ""):
                 # Continuation after list
-                parts.append("".join(child.itertext()).strip())
+                parts.append(self._extract_text(child))
 
             else:
                 # Other content
-                text = "".join(child.itertext()).strip()
+                text = self._extract_text(child)
                 if text:
                     parts.append(text)
 
@@ -291,7 +333,7 @@ class LovdataChunker:
 
         for li in list_elem.findall(".//li"):
             marker = li.get("data-name", "")
-            text = "".join(li.itertext()).strip()
+            text = self._extract_text(li)
             if marker:
                 items.append(f"{marker} {text}")
             else:
@@ -323,8 +365,9 @@ class LovdataChunker:
         Returns:
             List of sub-chunks
         """
-        # Check if contains lists
-        has_lists = ledd_elem.find(".//ol") is not None or ledd_elem.find(".//ul") is not None
+        # Check if contains lists (one walk for both list tags; the ledd itself
+        # is an article, so iter() including it does not matter)
+        has_lists = next(ledd_elem.iter("ol", "ul"), None) is not None
 
         if has_lists:
             return self._split_by_lists(
@@ -375,7 +418,7 @@ class LovdataChunker:
                 parts.append(list_text)
             else:
                 # Accumulate non-list text
-                text = "".join(child.itertext()).strip()
+                text = self._extract_text(child)
                 if text:
                     current_text.append(text)
 
@@ -432,9 +475,11 @@ class LovdataChunker:
         Returns:
             List of overlapping chunks
         """
-        # Split into sentences (Norwegian-aware)
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
+
+        # Overlapping windows revisit sentences, so each is counted once up
+        # front. prefix[k] is the token total of sentences[:k].
+        prefix = [0, *accumulate(map(self._count_tokens, sentences))]
 
         chunks = []
         overlap_count = max(1, int(len(sentences) * self.overlap / self.target))
@@ -443,25 +488,14 @@ class LovdataChunker:
         chunk_idx = 1
 
         while i < len(sentences):
-            # Accumulate sentences up to target
-            chunk_sentences = []
-            chunk_tokens = 0
-
-            j = i
-            while j < len(sentences):
-                sent = sentences[j]
-                sent_tokens = self._count_tokens(sent)
-
-                if chunk_tokens + sent_tokens <= self.target:
-                    chunk_sentences.append(sent)
-                    chunk_tokens += sent_tokens
-                    j += 1
-                else:
-                    break
+            # Accumulate sentences up to target: the window ends at the last
+            # sentence whose running total still fits
+            j = max(i, bisect_right(prefix, prefix[i] + self.target) - 1)
+            chunk_tokens = prefix[j] - prefix[i]
 
             # Create chunk
-            if chunk_sentences:
-                chunk_text = " ".join(chunk_sentences)
+            if j > i:
+                chunk_text = " ".join(sentences[i:j])
 
                 chunk = Chunk(
                     chunk_id=f"{paragraph_ref}-ledd{ledd_num}-{chunk_idx}",
@@ -494,8 +528,7 @@ class LovdataChunker:
         Returns:
             List of sentence-based chunks
         """
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
         chunks = []
         chunk_idx = 1
@@ -518,6 +551,18 @@ class LovdataChunker:
 
         return chunks
 
+    @staticmethod
+    def _split_sentences(text: str) -> list[str]:
+        """Split text into stripped, non-empty sentences.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of sentences
+        """
+        return [s for s in map(str.strip, _SENTENCE_BOUNDARY.split(text)) if s]
+
     def _create_chunk(
         self,
         text,
@@ -592,7 +637,7 @@ class LovdataChunker:
     # Helper methods
 
     def _count_tokens(self, text: str) -> int:
-        """Count tokens using tiktoken.
+        """Count tokens using tiktoken (memoized across chunker instances).
 
         Args:
             text: Text to count
@@ -600,7 +645,7 @@ class LovdataChunker:
         Returns:
             Number of tokens
         """
-        return len(self.encoding.encode(text))
+        return count_tokens(text)
 
     def _extract_text(self, elem) -> str:
         """Extract all text from element.
@@ -611,46 +656,74 @@ class LovdataChunker:
         Returns:
             Extracted text
         """
-        return "".join(elem.itertext()).strip()
+        # Comments and processing instructions carry no document text (inside
+        # an element they are skipped by the serializer as well)
+        if not isinstance(elem.tag, str):
+            return ""
+        # Serialized in one C call instead of joining an itertext() generator
+        return etree.tostring(elem, method="text", encoding="unicode", with_tail=False).strip()
 
-    def _get_paragraph_ref(self, article_elem) -> str:
-        """Extract § reference (e.g., '§ 5').
+    def _get_paragraph_header(self, article_elem) -> tuple[str, str | None]:
+        """Extract the § reference (e.g., '§ 5') and title in one subtree walk.
 
         Args:
             article_elem: legalArticle XML element
 
         Returns:
-            Paragraph reference
+            Tuple of (paragraph reference or "", paragraph title or None)
         """
-        header = article_elem.find('.//span[@class="legalArticleValue"]')
-        return "".join(header.itertext()).strip() if header is not None else ""
+        value = title = None
+        for span in article_elem.iter("span"):
+            span_class = span.get("class")
+            if value is None and span_class == "legalArticleValue":
+                value = span
+            elif title is None and span_class == "legalArticleTitle":
+                title = span
+            else:
+                continue
+            if value is not None and title is not None:
+                break
 
-    def _get_paragraph_title(self, article_elem) -> str | None:
-        """Extract paragraph title if exists.
+        paragraph_ref = self._extract_text(value) if value is not None else ""
+        paragraph_title = self._extract_text(title) if title is not None else None
+        return paragraph_ref, paragraph_title
+
+    def _get_section_heading(self, section_elem) -> str:
+        """Extract section heading.
 
         Args:
-            article_elem: legalArticle XML element
+            section_elem: section XML element
 
         Returns:
-            Paragraph title or None
+            Section heading text
         """
-        title = article_elem.find('.//span[@class="legalArticleTitle"]')
-        return "".join(title.itertext()).strip() if title is not None else None
+        # One walk instead of a full-subtree find() per level: the first h2
+        # wins outright, otherwise the first h3, then the first h4
+        fallback = {}
+        for heading in section_elem.iter("h2", "h3", "h4"):
+            if heading is section_elem:
+                continue
+            if heading.tag == "h2":
+                return self._extract_text(heading)
+            fallback.setdefault(heading.tag, heading)
 
-    def _get_section_heading(self, section_elem) -> str:
-        """Extract section heading.
+        heading = fallback.get("h3", fallback.get("h4"))
+        return self._extract_text(heading) if heading is not None else ""
+
+    def _get_cached_section_heading(self, section_elem, section_headings: dict) -> str:
+        """Get a section's heading, extracting it only on first use.
 
         Args:
             section_elem: section XML element
+            section_headings: Per-document cache of section element -> heading
 
         Returns:
             Section heading text
         """
-        for tag in ["h2", "h3", "h4"]:
-            heading = section_elem.find(f".//{tag}")
-            if heading is not None:
-                return "".join(heading.itertext()).strip()
-        return ""
+        heading = section_headings.get(section_elem)
+        if heading is None:
+            heading = section_headings[section_elem] = self._get_section_heading(section_elem)
+        return heading
 
     def _get_document_title(self, root) -> str:
         """Extract document title from h1.
@@ -662,36 +735,41 @@ class LovdataChunker:
             Document title
         """
         h1 = root.find(".//h1")
-        return "".join(h1.itertext()).strip() if h1 is not None else ""
+        return self._extract_text(h1) if h1 is not None else ""
 
-    def _get_hierarchical_context(self, elem, root) -> dict:
+    def _get_hierarchical_context(
+        self, elem, document_title: str, section_headings: dict | None = None
+    ) -> dict:
         """Walk up tree to collect chapter/section hierarchy.
 
         Args:
             elem: Current XML element
-            root: XML root element
+            document_title: Title of the document elem belongs to
+            section_headings: Per-document cache of section element -> heading,
+                filled in as sections are visited
 
         Returns:
             Context dict with document title, chapter path, section heading
         """
-        context = {
-            "document_title": self._get_document_title(root),
-            "chapter_path": [],
-            "section_heading": "",
-        }
-
-        current = elem.getparent()
-        while current is not None:
-            if current.get("class") == "section":
-                heading = self._get_section_heading(current)
+        # Every article in a section would otherwise re-extract the heading of
+        # each enclosing section, and every chunk would hold its own copy of it
+        if section_headings is None:
+            section_headings = {}
+
+        # One ancestor walk driven by lxml, innermost section first
+        headings = []
+        for ancestor in elem.iterancestors():
+            if ancestor.get("class") == "section":
+                heading = self._get_cached_section_heading(ancestor, section_headings)
                 if heading:
-                    if not context["section_heading"]:
-                        context["section_heading"] = heading
-                    context["chapter_path"].insert(0, heading)
+                    headings.append(heading)
 
-            current = current.getparent()
-
-        return context
+        return {
+            "document_title": document_title,
+            # Outermost first
+            "chapter_path": headings[::-1],
+            "section_heading": headings[0] if headings else "",
+        }
 
     def _get_cross_refs(self, elem) -> list[str]:
         """Extract cross-references (href values).
@@ -722,108 +800,87 @@ class LovdataChunker:
             return chunks
 
         merged = []
-        buffer = []
+        # Greedy sweep over indices: the buffer is always chunks[start:end], so
+        # nothing is copied until a run is flushed
+        start = 0
         buffer_tokens = 0
-        buffer_ids = []
 
-        for chunk in chunks:
-            # Add to buffer
-            buffer.append(chunk)
+        for end, chunk in enumerate(chunks, 1):
             buffer_tokens += chunk.token_count
-            buffer_ids.append(chunk.chunk_id)
 
-            # Check if we should flush buffer
-            # Conditions: reached minimum OR would exceed max with next potential chunk
-            should_flush = False
-
-            # Have we reached minimum?
+            # Flush once the minimum is reached, or when one more chunk of the
+            # buffer's average size would exceed max
             if (
                 buffer_tokens >= self.min
-                or buffer_tokens + (buffer_tokens // len(buffer)) > self.max
+                or buffer_tokens + buffer_tokens // (end - start) > self.max
             ):
-                should_flush = True
+                merged.append(self._merge_run(chunks[start:end], buffer_tokens))
+                start = end
+                buffer_tokens = 0
 
-            if should_flush:
-                # Create merged chunk from buffer
-                if len(buffer) == 1:
-                    # Single chunk, keep as-is
-                    merged.append(buffer[0])
-                else:
-                    # Merge multiple chunks
-                    merged_text = "\n\n".join(c.text for c in buffer)
-                    merged_chunk = Chunk(
-                        chunk_id=buffer[0].chunk_id,
+        # Handle remaining buffer
+        if start == len(chunks) - 1:
+            last = chunks[start]
+            # Try to merge last small chunk with previous
+            if last.token_count < self.min and merged:
+                prev_chunk = merged[-1]
+                combined_tokens = prev_chunk.token_count + last.token_count
+                if combined_tokens <= self.max:
+                    merged_text = f"{prev_chunk.text}\n\n{last.text}"
+                    merged[-1] = Chunk(
+                        chunk_id=prev_chunk.chunk_id,
                         text=merged_text,
-                        token_count=buffer_tokens,
+                        token_count=combined_tokens,
                         metadata={
-                            **buffer[0].metadata,
-                            "merged_with": buffer_ids[1:],
+                            **prev_chunk.metadata,
+                            "merged_with": (
+                                prev_chunk.metadata.get("merged_with", []) + [last.chunk_id]
+                                if isinstance(prev_chunk.metadata.get("merged_with"), list)
+                                else [last.chunk_id]
+                            ),
                             "merged": True,
-                            "merged_count": len(buffer),
                         },
                     )
-                    merged.append(merged_chunk)
                     logger.debug(
-                        f"Merged {len(buffer)} small chunks "
-                        f"({', '.join(buffer_ids)}) into {buffer_tokens} tokens"
+                        f"Merged last small chunk {last.chunk_id} "
+                        f"({last.token_count} tokens) with previous"
                     )
-
-                # Reset buffer
-                buffer = []
-                buffer_tokens = 0
-                buffer_ids = []
-
-        # Handle remaining buffer
-        if buffer:
-            if len(buffer) == 1:
-                # Try to merge last small chunk with previous
-                if buffer[0].token_count < self.min and merged:
-                    prev_chunk = merged[-1]
-                    combined_tokens = prev_chunk.token_count + buffer[0].token_count
-                    if combined_tokens <= self.max:
-                        merged_text = f"{prev_chunk.text}\n\n{buffer[0].text}"
-                        merged[-1] = Chunk(
-                            chunk_id=prev_chunk.chunk_id,
-                            text=merged_text,
-                            token_count=combined_tokens,
-                            metadata={
-                                **prev_chunk.metadata,
-                                "merged_with": (
-                                    prev_chunk.metadata.get("merged_with", [])
-                                    + [buffer[0].chunk_id]
-                                    if isinstance(prev_chunk.metadata.get("merged_with"), list)
-                                    else [buffer[0].chunk_id]
-                                ),
-                                "merged": True,
-                            },
-                        )
-                        logger.debug(
-                            f"Merged last small chunk {buffer[0].chunk_id} "
-                            f"({buffer[0].token_count} tokens) with previous"
-                        )
-                    else:
-                        merged.append(buffer[0])
                 else:
-                    merged.append(buffer[0])
+                    merged.append(last)
             else:
-                # Multiple chunks in buffer - merge them
-                merged_text = "\n\n".join(c.text for c in buffer)
-                buffer_ids = [c.chunk_id for c in buffer]
-                merged_chunk = Chunk(
-                    chunk_id=buffer[0].chunk_id,
-                    text=merged_text,
-                    token_count=buffer_tokens,
-                    metadata={
-                        **buffer[0].metadata,
-                        "merged_with": buffer_ids[1:],
-                        "merged": True,
-                        "merged_count": len(buffer),
-                    },
-                )
-                merged.append(merged_chunk)
-                logger.debug(
-                    f"Merged final {len(buffer)} small chunks "
-                    f"({', '.join(buffer_ids)}) into {buffer_tokens} tokens"
-                )
+                merged.append(last)
+        elif start < len(chunks):
+            merged.append(self._merge_run(chunks[start:], buffer_tokens, "final "))
 
         return merged
+
+    def _merge_run(self, run: list[Chunk], tokens: int, label: str = "") -> Chunk:
+        """Merge consecutive chunks into one carrying the first chunk's ID and metadata.
+
+        Args:
+            run: Consecutive chunks to merge
+            tokens: Total token count of the run
+            label: Word inserted in the debug message (e.g. "final ")
+
+        Returns:
+            The single chunk of a one-chunk run, otherwise the merged chunk
+        """
+        if len(run) == 1:
+            return run[0]
+
+        ids = [c.chunk_id for c in run]
+        merged_chunk = Chunk(
+            chunk_id=ids[0],
+            text="\n\n".join(c.text for c in run),
+            token_count=tokens,
+            metadata={
+                **run[0].metadata,
+                "merged_with": ids[1:],
+                "merged": True,
+                "merged_count": len(run),
+            },
+        )
+        logger.debug(
+            f"Merged {label}{len(run)} small chunks ({', '.join(ids)}) into {tokens} tokens"
+        )
+        return merged_chunk
@@ -5,6 +5,7 @@ Single Responsibility: Generate embeddings for chunks using a provider.
 """
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 from lovdata_pipeline.domain.embedding_provider import EmbeddingProvider
@@ -18,15 +19,26 @@ class EmbeddingService:
     decoupled from progress tracking and specific embedding implementations.
     """
 
-    def __init__(self, provider: EmbeddingProvider, batch_size: int = 100):
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        batch_size: int = 100,
+        max_concurrent_requests: int = 1,
+        max_batch_tokens: int | None = None,
+    ):
         """Initialize embedding service.
 
         Args:
             provider: Embedding provider implementation
-            batch_size: Number of chunks to embed in each batch
+            batch_size: Maximum number of chunks to embed in each batch
+            max_concurrent_requests: Batches of one call that may be in flight at once
+            max_batch_tokens: Token budget per batch (None for count-only batching).
+                A single chunk above the budget is sent on its own.
         """
         self._provider = provider
-        self._batch_size = batch_size
+        self._batch_size = max(1, batch_size)
+        self._max_concurrent_requests = max(1, max_concurrent_requests)
+        self._max_batch_tokens = max_batch_tokens
 
     def embed_chunks(
         self,
@@ -35,6 +47,10 @@ class EmbeddingService:
     ) -> list[EnrichedChunk]:
         """Embed chunks in batches.
 
+        With max_concurrent_requests > 1 the batches are dispatched from a small
+        thread pool, so several API round-trips overlap. Results and progress
+        are still delivered in input order.
+
         Args:
             chunks: List of chunks to embed
             progress_callback: Optional callback(current, total) for progress tracking
@@ -48,36 +64,85 @@ class EmbeddingService:
         all_enriched = []
         total_chunks = len(chunks)
         model_name = self._provider.get_model_name()
-
-        for i in range(0, len(chunks), self._batch_size):
-            batch = chunks[i : i + self._batch_size]
-            texts = [c.text for c in batch]
-
-            # Get embeddings from provider
-            embeddings = self._provider.embed_batch(texts)
-
-            # Create enriched chunks
-            embedded_at = datetime.now(UTC).isoformat()
-            for chunk, embedding in zip(batch, embeddings, strict=True):
-                enriched = EnrichedChunk(
-                    chunk_id=chunk.chunk_id,
-                    document_id=chunk.document_id,
-                    dataset_name=chunk.dataset_name,
-                    content=chunk.content,
-                    token_count=chunk.token_count,
-                    section_heading=chunk.section_heading,
-                    absolute_address=chunk.absolute_address,
-                    split_reason=chunk.split_reason,
-                    parent_chunk_id=chunk.parent_chunk_id,
-                    source_hash=chunk.source_hash,
-                    embedding=embedding,
-                    embedding_model=model_name,
-                    embedded_at=embedded_at,
-                )
-                all_enriched.append(enriched)
-
-            # Call progress callback if provided
-            if progress_callback:
-                progress_callback(len(all_enriched), total_chunks)
+        # One timestamp per call: every chunk of a file (or file group) shares it
+        embedded_at = datetime.now(UTC).isoformat()
+
+        batches = self._pack(chunks)
+        texts = ([c.text for c in batch] for batch in batches)
+        workers = min(self._max_concurrent_requests, len(batches))
+
+        if workers > 1:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed")
+            # map() keeps at most `workers` requests running and yields in order
+            results = executor.map(self._provider.embed_batch, texts)
+        else:
+            executor = None
+            results = map(self._provider.embed_batch, texts)
+
+        try:
+            for batch, embeddings in zip(batches, results, strict=True):
+                self._enrich(batch, embeddings, model_name, embedded_at, all_enriched)
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(len(all_enriched), total_chunks)
+        finally:
+            if executor is not None:
+                # Do not start queued batches once one has failed
+                executor.shutdown(cancel_futures=True)
 
         return all_enriched
+
+    def _pack(self, chunks: list[ChunkMetadata]) -> list[list[ChunkMetadata]]:
+        """Split chunks into consecutive batches under the item and token limits.
+
+        Greedy and order-preserving: a batch is closed when it holds batch_size
+        chunks or the next chunk would push it past max_batch_tokens.
+        """
+        if self._max_batch_tokens is None:
+            return [
+                chunks[i : i + self._batch_size] for i in range(0, len(chunks), self._batch_size)
+            ]
+
+        batches = []
+        start = 0
+        tokens = 0
+        for i, chunk in enumerate(chunks):
+            count = i - start
+            if count and (
+                count >= self._batch_size or tokens + chunk.token_count > self._max_batch_tokens
+            ):
+                batches.append(chunks[start:i])
+                start = i
+                tokens = 0
+            tokens += chunk.token_count
+        if start < len(chunks):
+            batches.append(chunks[start:])
+        return batches
+
+    @staticmethod
+    def _enrich(
+        batch: list[ChunkMetadata],
+        embeddings: list[list[float]],
+        model_name: str,
+        embedded_at: str,
+        out: list[EnrichedChunk],
+    ) -> None:
+        """Pair a batch of chunks with their embeddings and append them to out."""
+        for chunk, embedding in zip(batch, embeddings, strict=True):
+            enriched = EnrichedChunk(
+                chunk_id=chunk.chunk_id,
+                document_id=chunk.document_id,
+                dataset_name=chunk.dataset_name,
+                content=chunk.content,
+                token_count=chunk.token_count,
+                section_heading=chunk.section_heading,
+                absolute_address=chunk.absolute_address,
+                split_reason=chunk.split_reason,
+                parent_chunk_id=chunk.parent_chunk_id,
+                source_hash=chunk.source_hash,
+                embedding=embedding,
+                embedding_model=model_name,
+                embedded_at=embedded_at,
+            )
+            out.append(enriched)
@@ -2,12 +2,28 @@
 
 Responsible for coordinating the complete processing of a single file.
 Single Responsibility: Orchestrate chunk -> embed -> index for one file.
+
+Chunking is CPU and disk bound while embedding waits on the network, so callers
+that know which files come next can prefetch() them: their chunks are produced
+on a background thread while the current file is embedded and indexed.
+
+Chunking is pure-Python work that holds the GIL, so worker threads cannot run
+it in parallel. With chunk_processes > 0 every file is chunked in a pool of
+worker processes instead, both when prefetched and when processed directly.
 """
 
 import logging
+import multiprocessing
+import threading
 from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-from lovdata_pipeline.domain.models import FileInfo, FileProcessingResult
+from lovdata_pipeline.domain.models import (
+    ChunkMetadata,
+    EnrichedChunk,
+    FileInfo,
+    FileProcessingResult,
+)
 from lovdata_pipeline.domain.services.chunking_service import ChunkingService
 from lovdata_pipeline.domain.services.embedding_service import EmbeddingService
 from lovdata_pipeline.domain.vector_store import VectorStoreRepository
@@ -27,17 +43,82 @@ class FileProcessingService:
         chunking_service: ChunkingService,
         embedding_service: EmbeddingService,
         vector_store: VectorStoreRepository,
+        chunk_processes: int = 0,
     ):
         """Initialize file processing service.
 
         Args:
-            chunking_service: Service for chunking XML files
+            chunking_service: Service for chunking XML files (must be picklable
+                when chunk_processes > 0)
             embedding_service: Service for generating embeddings
             vector_store: Repository for storing vectors
+            chunk_processes: Worker processes for chunking (0 = chunk in this process)
         """
         self._chunking_service = chunking_service
         self._embedding_service = embedding_service
         self._vector_store = vector_store
+        self._chunk_processes = max(0, chunk_processes)
+        # Background chunkers, created on first use. Worker threads may ask for
+        # them concurrently, so creation happens under the lock.
+        self._executor_lock = threading.Lock()
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        self._chunk_pool: ProcessPoolExecutor | None = None
+        self._prefetched: dict[FileInfo, Future] = {}
+
+    def prefetch(self, file_infos: list[FileInfo]) -> None:
+        """Start chunking files in the background ahead of processing them.
+
+        A later process_file()/process_files() call for the same file picks up
+        the prefetched chunks (or the chunking error) instead of chunking again.
+
+        Args:
+            file_infos: Files that will be processed next
+        """
+        if self._chunk_processes:
+            executor: Executor = self._process_pool()
+        else:
+            with self._executor_lock:
+                if self._prefetch_executor is None:
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="chunk-prefetch"
+                    )
+                executor = self._prefetch_executor
+        for file_info in file_infos:
+            if file_info not in self._prefetched:
+                self._prefetched[file_info] = executor.submit(
+                    _chunk_file, self._chunking_service, file_info
+                )
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """Get the chunking process pool, starting it on first use."""
+        with self._executor_lock:
+            if self._chunk_pool is None:
+                # spawn: worker threads may be running, which makes fork unsafe
+                self._chunk_pool = ProcessPoolExecutor(
+                    max_workers=self._chunk_processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._chunk_pool
+
+    def cancel_prefetch(self) -> None:
+        """Drop prefetched chunks that were never consumed."""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+
+    def close(self) -> None:
+        """Stop background chunking threads and processes.
+
+        They are started again on demand, so the service stays usable.
+        """
+        self.cancel_prefetch()
+        with self._executor_lock:
+            executors = (self._prefetch_executor, self._chunk_pool)
+            self._prefetch_executor = None
+            self._chunk_pool = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     def process_file(
         self,
@@ -60,72 +141,268 @@ class FileProcessingService:
             FileProcessingResult with success status, chunk count, and optional error
         """
         try:
-            # 1. Validate file exists
-            if not file_info.path.exists():
-                return FileProcessingResult(
-                    success=False,
-                    chunk_count=0,
-                    error_message=f"File not found: {file_info.path}",
-                )
+            # 1-2. Validate and chunk
+            chunked = self._take_chunks(file_info, warning_callback)
+            if isinstance(chunked, FileProcessingResult):
+                return chunked
 
-            # 2. Chunk XML file directly
-            all_chunks = self._chunking_service.chunk_file(
-                file_info.path,
-                file_info.doc_id,
-                file_info.dataset,
-                file_info.hash,
-            )
+            # 3-5. Embed, assign IDs and index
+            return self._embed_and_index(file_info, chunked, progress_callback)
 
-            if not all_chunks:
-                # Empty/obsolete laws with no content are valid - not an error
-                info_msg = f"{file_info.doc_id} has no content (obsolete/empty law)"
-                logger.info(info_msg)
-                if warning_callback:
-                    warning_callback(info_msg)
-                return FileProcessingResult(
-                    success=True,  # Successfully processed, just empty
-                    chunk_count=0,
-                    error_message=None,
-                )
+        except Exception as e:
+            return self._fail(file_info, e)
+
+    def process_files(
+        self,
+        file_infos: list[FileInfo],
+        progress_callback: Callable[[int, int], None] | None = None,
+        warning_callback: Callable[[str], None] | None = None,
+    ) -> list[FileProcessingResult]:
+        """Process several files, sharing embedding requests between them.
+
+        Small documents yield far fewer chunks than one embedding batch holds,
+        so embedding them one by one wastes a request round-trip per file.
+        Here all files are chunked first, their chunks are embedded together,
+        and the embeddings are scattered back for per-file indexing.
+
+        The group's vectors are then written with a single upsert.
+
+        Chunking failures only fail the affected file. If the shared embedding
+        call or the shared upsert fails, that step is retried per file so the
+        failure is pinned to the file that caused it.
+
+        Args:
+            file_infos: Files to process
+            progress_callback: Optional callback(current, total) for embedding progress
+            warning_callback: Optional callback(message) for warnings
+
+        Returns:
+            One FileProcessingResult per input file, in input order
+        """
+        results: list[FileProcessingResult | None] = [None] * len(file_infos)
+        pending = self._chunk_group(file_infos, warning_callback, results)
+        if pending:
+            enriched = self._embed_group(file_infos, pending, progress_callback, results)
+            if enriched is not None:
+                self._upsert_group(file_infos, pending, enriched, results)
+        return results
+
+    def _chunk_group(
+        self,
+        file_infos: list[FileInfo],
+        warning_callback: Callable[[str], None] | None,
+        results: list[FileProcessingResult | None],
+    ) -> list[tuple[int, list[ChunkMetadata]]]:
+        """Chunk each file of a group, recording results for files that end here.
+
+        Returns:
+            (index, chunks) of the files that still need embedding
+        """
+        pending: list[tuple[int, list[ChunkMetadata]]] = []
+        for idx, file_info in enumerate(file_infos):
+            try:
+                chunked = self._take_chunks(file_info, warning_callback)
+            except Exception as e:
+                results[idx] = self._fail(file_info, e)
+                continue
+            if isinstance(chunked, FileProcessingResult):
+                results[idx] = chunked
+            else:
+                pending.append((idx, chunked))
+        return pending
+
+    def _embed_group(
+        self,
+        file_infos: list[FileInfo],
+        pending: list[tuple[int, list[ChunkMetadata]]],
+        progress_callback: Callable[[int, int], None] | None,
+        results: list[FileProcessingResult | None],
+    ) -> list[EnrichedChunk] | None:
+        """Embed the pending files' chunks in shared requests.
 
-            logger.debug(f"  Chunked: {len(all_chunks)} chunks")
+        If the shared call fails, each file is embedded and indexed on its own
+        with the chunks already in hand, and its result recorded.
 
-            # 3. Embed chunks
+        Returns:
+            Enriched chunks in pending order, or None if the files were handled
+            one by one
+        """
+        pooled = [chunk for _, chunks in pending for chunk in chunks]
+        try:
             enriched = self._embedding_service.embed_chunks(
-                all_chunks,
+                pooled,
                 progress_callback=progress_callback,
             )
-            logger.debug(f"  Embedded: {len(enriched)} chunks")
+        except Exception as e:
+            logger.debug(f"  Shared embedding of {len(pending)} files failed: {e}")
+            for idx, chunks in pending:
+                try:
+                    results[idx] = self._embed_and_index(file_infos[idx], chunks)
+                except Exception as file_error:
+                    results[idx] = self._fail(file_infos[idx], file_error)
+            return None
 
-            # 4. Generate vector IDs
-            vector_ids = [f"{file_info.doc_id}_chunk_{i}" for i in range(len(enriched))]
+        logger.debug(f"  Embedded: {len(enriched)} chunks for {len(pending)} files")
+        return enriched
 
-            # Set IDs on enriched chunks
-            for chunk, vid in zip(enriched, vector_ids, strict=True):
-                chunk.chunk_id = vid
+    def _upsert_group(
+        self,
+        file_infos: list[FileInfo],
+        pending: list[tuple[int, list[ChunkMetadata]]],
+        enriched: list[EnrichedChunk],
+        results: list[FileProcessingResult | None],
+    ) -> None:
+        """Assign vector IDs per file and write the group's vectors in one upsert.
+
+        If the shared upsert fails, it is retried per file (upserts are
+        idempotent) so the failure is pinned to the file that caused it.
+        """
+        per_file: list[tuple[int, list[EnrichedChunk]]] = []
+        offset = 0
+        for idx, chunks in pending:
+            file_enriched = enriched[offset : offset + len(chunks)]
+            offset += len(chunks)
+            self._assign_ids(file_infos[idx], file_enriched)
+            per_file.append((idx, file_enriched))
 
-            # 5. Index in vector store (upsert = replace old if exists)
+        # One upsert for the whole group pays the store's per-call cost once
+        try:
             self._vector_store.upsert_chunks(enriched)
-            logger.debug(f"  Indexed: {len(vector_ids)} vectors")
+        except Exception as e:
+            logger.debug(f"  Shared upsert of {len(pending)} files failed: {e}")
+            for idx, file_enriched in per_file:
+                try:
+                    self._vector_store.upsert_chunks(file_enriched)
+                except Exception as file_error:
+                    results[idx] = self._fail(file_infos[idx], file_error)
+                    continue
+                results[idx] = FileProcessingResult(success=True, chunk_count=len(file_enriched))
+            return
 
-            return FileProcessingResult(
-                success=True,
-                chunk_count=len(all_chunks),
-            )
+        logger.debug(f"  Indexed: {len(enriched)} vectors for {len(pending)} files")
+        for idx, file_enriched in per_file:
+            results[idx] = FileProcessingResult(success=True, chunk_count=len(file_enriched))
 
-        except Exception as e:
-            logger.debug(f"  Failed: {e}")
+    def _take_chunks(
+        self,
+        file_info: FileInfo,
+        warning_callback: Callable[[str], None] | None,
+    ) -> list[ChunkMetadata] | FileProcessingResult:
+        """Get a file's prefetched chunks, or chunk it now if it was not prefetched."""
+        future = self._prefetched.pop(file_info, None)
+        if future is not None and future.cancelled():
+            future = None
+        if future is None and self._chunk_processes:
+            future = self._process_pool().submit(_chunk_file, self._chunking_service, file_info)
 
-            # Clean up ALL chunks for this document (simpler than tracking partial state)
-            try:
-                deleted = self._vector_store.delete_by_document_id(file_info.doc_id)
-                if deleted > 0:
-                    logger.debug(f"  Cleaned up {deleted} chunks for {file_info.doc_id}")
-            except Exception as cleanup_error:
-                logger.debug(f"  Failed to clean up chunks: {cleanup_error}")
+        if future is not None:
+            # Re-raises a chunking error exactly as a direct call would
+            chunked = future.result()
+        else:
+            chunked = _chunk_file(self._chunking_service, file_info)
+        return self._check_chunks(file_info, chunked, warning_callback)
 
+    def _check_chunks(
+        self,
+        file_info: FileInfo,
+        all_chunks: list[ChunkMetadata] | FileProcessingResult,
+        warning_callback: Callable[[str], None] | None,
+    ) -> list[ChunkMetadata] | FileProcessingResult:
+        """Return a file's chunks, or its final result if there is nothing to embed."""
+        if isinstance(all_chunks, FileProcessingResult):
+            return all_chunks
+
+        if not all_chunks:
+            # Empty/obsolete laws with no content are valid - not an error
+            info_msg = f"{file_info.doc_id} has no content (obsolete/empty law)"
+            logger.info(info_msg)
+            if warning_callback:
+                warning_callback(info_msg)
             return FileProcessingResult(
-                success=False,
+                success=True,  # Successfully processed, just empty
                 chunk_count=0,
-                error_message=str(e),
+                error_message=None,
             )
+
+        logger.debug(f"  Chunked: {len(all_chunks)} chunks")
+        return all_chunks
+
+    def _embed_and_index(
+        self,
+        file_info: FileInfo,
+        chunks: list[ChunkMetadata],
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> FileProcessingResult:
+        """Embed one file's chunks and index them."""
+        # 3. Embed chunks
+        enriched = self._embedding_service.embed_chunks(
+            chunks,
+            progress_callback=progress_callback,
+        )
+        logger.debug(f"  Embedded: {len(enriched)} chunks")
+
+        # 4-5. Assign IDs and index
+        self._index(file_info, enriched)
+
+        return FileProcessingResult(
+            success=True,
+            chunk_count=len(chunks),
+        )
+
+    def _index(self, file_info: FileInfo, enriched: list[EnrichedChunk]) -> None:
+        """Assign vector IDs to a file's embedded chunks and upsert them."""
+        # 4. Set vector IDs on enriched chunks
+        self._assign_ids(file_info, enriched)
+
+        # 5. Index in vector store (upsert = replace old if exists)
+        self._vector_store.upsert_chunks(enriched)
+        logger.debug(f"  Indexed: {len(enriched)} vectors")
+
+    @staticmethod
+    def _assign_ids(file_info: FileInfo, enriched: list[EnrichedChunk]) -> None:
+        """Set a file's vector IDs on its embedded chunks (no intermediate ID list)."""
+        id_prefix = f"{file_info.doc_id}_chunk_"
+        for i, chunk in enumerate(enriched):
+            chunk.chunk_id = id_prefix + str(i)
+
+    def _fail(self, file_info: FileInfo, error: Exception) -> FileProcessingResult:
+        """Delete a failed document's chunks and build its failure result."""
+        logger.debug(f"  Failed: {error}")
+
+        # Clean up ALL chunks for this document (simpler than tracking partial state)
+        try:
+            deleted = self._vector_store.delete_by_document_id(file_info.doc_id)
+            if deleted > 0:
+                logger.debug(f"  Cleaned up {deleted} chunks for {file_info.doc_id}")
+        except Exception as cleanup_error:
+            logger.debug(f"  Failed to clean up chunks: {cleanup_error}")
+
+        return FileProcessingResult(
+            success=False,
+            chunk_count=0,
+            error_message=str(error),
+        )
+
+
+def _chunk_file(
+    chunking_service: ChunkingService, file_info: FileInfo
+) -> list[ChunkMetadata] | FileProcessingResult:
+    """Validate and chunk one file.
+
+    Module level so a process pool can run it; the result travels back pickled.
+    """
+    # 1. Validate file exists
+    if not file_info.path.exists():
+        return FileProcessingResult(
+            success=False,
+            chunk_count=0,
+            error_message=f"File not found: {file_info.path}",
+        )
+
+    # 2. Chunk XML file directly
+    return chunking_service.chunk_file(
+        file_info.path,
+        file_info.doc_id,
+        file_info.dataset,
+        file_info.hash,
+    )
@@ -12,11 +12,16 @@ from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+# Compiled once rather than per chunk by element.xpath()
+_ANCESTOR_SECTIONS = etree.XPath("ancestor::section[@class='section']")
+
+# Header <dd> classes read by extract_document_info
+_DOCUMENT_INFO_CLASSES = frozenset({"title", "titleShort", "dokid", "ministry"})
+
 
 # Helper functions for clean XML extraction
-def _get_xml_text(root: etree._Element, xpath: str) -> str | None:
-    """Extract text from XML element using XPath."""
-    elem = root.find(xpath)
+def _element_text(elem: etree._Element | None) -> str | None:
+    """Get an element's own stripped text."""
     return elem.text.strip() if elem is not None and elem.text else None
 
 
@@ -152,24 +157,53 @@ def extract_document_info(
     """Extract document-level information."""
     metadata = {}
 
-    if title := _get_xml_text(xml_root, './/dd[@class="title"]'):
+    # One walk over the <dd> elements instead of a whole-tree find() per
+    # field; like find(), the first match per class wins
+    found = _find_document_info(xml_root)
+
+    if title := _element_text(found.get("title")):
         metadata["document_title"] = title
 
-    if short_title := _get_xml_text(xml_root, './/dd[@class="titleShort"]'):
+    if short_title := _element_text(found.get("titleShort")):
         metadata["document_short_title"] = short_title
 
     # Extract date from dokid (e.g., "NL/lov/1751-10-02")
-    if (dokid := _get_xml_text(xml_root, './/dd[@class="dokid"]')) and (
+    if (dokid := _element_text(found.get("dokid"))) and (
         date_match := re.search(r"(\d{4}-\d{2}-\d{2})", dokid)
     ):
         metadata["document_date"] = date_match.group(1)
 
-    if dept := _get_xml_text(xml_root, './/dd[@class="ministry"]//li'):
+    if dept := _element_text(found.get("ministry")):
         metadata["department"] = dept
 
     return metadata
 
 
+def _find_document_info(xml_root: etree._Element) -> dict[str, etree._Element]:
+    """Find the first header element for each document info field in one walk.
+
+    Returns:
+        Mapping of dd class to its first <dd>; for "ministry", the first <li>
+        inside a ministry <dd>
+    """
+    found: dict[str, etree._Element] = {}
+    for dd in xml_root.iter("dd"):
+        dd_class = dd.get("class")
+        if dd_class not in _DOCUMENT_INFO_CLASSES or dd_class in found:
+            continue
+        if dd_class == "ministry":
+            # Matches './/dd[@class="ministry"]//li': skip ministry entries without items
+            li = next(dd.iter("li"), None)
+            if li is None:
+                continue
+            found[dd_class] = li
+        else:
+            found[dd_class] = dd
+        if len(found) == len(_DOCUMENT_INFO_CLASSES):
+            break
+    return found
+
+
 def extract_location_info(
     chunk_data: dict[str, Any],
     xml_root: etree._Element,
@@ -287,7 +321,7 @@ def extract_section_context(
         metadata["section_heading"] = chunk_data["section_heading"]
     elif chunk_element is not None:
         # Try to find parent section heading
-        parent_section = chunk_element.xpath("ancestor::section[@class='section']")
+        parent_section = _ANCESTOR_SECTIONS(chunk_element)
         if parent_section:
             heading = parent_section[0].find(".//h2")
             if heading is not None and heading.text:
@@ -9,7 +9,7 @@ from lovdata_pipeline.domain.vector_store import VectorStoreRepository
 from lovdata_pipeline.state import ProcessingState
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of state validation."""
 
@@ -2,11 +2,62 @@
 
 This module provides a wrapper around tiktoken for counting tokens
 in Norwegian legal text using the cl100k_base encoding (GPT-4/GPT-3.5).
+
+Counting runs in tiktoken's compiled BPE encoder. Encodings are built once per
+process, and counts of short texts are memoized, since the same ledd, list
+items and sentences recur within and across documents.
 """
 
+from functools import lru_cache
+
 import tiktoken
 
 
+@lru_cache(maxsize=8)
+def get_encoding(encoding_name: str = "cl100k_base") -> tiktoken.Encoding:
+    """Get a shared tiktoken encoding, loading its BPE table only once.
+
+    Args:
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Cached tiktoken Encoding instance
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
+# Texts up to this length are memoized. Short texts are the ones that recur;
+# long ledd texts are counted once and would only evict them.
+_MEMO_MAX_CHARS = 2048
+
+
+def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    """Count tokens in text, memoizing results for short, repeated texts.
+
+    Counts are exact: they bound chunk sizes against the model's context limit.
+
+    Args:
+        text: Text to count tokens for
+        encoding_name: Name of the tiktoken encoding
+
+    Returns:
+        Number of tokens
+    """
+    if len(text) <= _MEMO_MAX_CHARS:
+        return _count_tokens_memoized(text, encoding_name)
+    return _count_tokens(text, encoding_name)
+
+
+def _count_tokens(text: str, encoding_name: str) -> int:
+    """Count tokens without memoization."""
+    # encode_ordinary skips the scan for special-token markers that encode()
+    # makes; the count is the same for text without them
+    return len(get_encoding(encoding_name).encode_ordinary(text))
+
+
+_count_tokens_memoized = lru_cache(maxsize=8192)(_count_tokens)
+
+
 class TokenCounter:
     """Count tokens in text using tiktoken.
 
@@ -19,7 +70,7 @@ class TokenCounter:
         Args:
             encoding_name: Name of the tiktoken encoding to use
         """
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = get_encoding(encoding_name)
         self.encoding_name = encoding_name
 
     def count_tokens(self, text: str) -> int:
@@ -31,7 +82,7 @@ class TokenCounter:
         Returns:
             Number of tokens
         """
-        return len(self.encoding.encode(text))
+        return count_tokens(text, self.encoding_name)
 
     def encode(self, text: str) -> list[int]:
         """Encode text to token IDs.
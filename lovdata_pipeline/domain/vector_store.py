@@ -40,6 +40,28 @@ class VectorStoreRepository(Protocol):
         """
         ...
 
+    def delete_by_document_ids(self, doc_ids: list[str]) -> dict[str, int]:
+        """Delete all vectors for several documents in one operation.
+
+        Args:
+            doc_ids: Document IDs to delete all chunks for
+
+        Returns:
+            Number of vectors deleted per document ID (0 if it had none)
+
+        Raises:
+            Exception: If deletion fails
+        """
+        ...
+
+    def ping(self) -> None:
+        """Check the store is reachable, doing as little work as possible.
+
+        Raises:
+            Exception: If the store cannot be reached
+        """
+        ...
+
     def count(self) -> int:
         """Get total count of vectors in the store.
 
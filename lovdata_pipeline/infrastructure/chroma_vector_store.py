@@ -1,9 +1,20 @@
 """ChromaDB vector store implementation."""
 
-from chromadb import Collection
+from typing import TYPE_CHECKING
 
 from lovdata_pipeline.domain.models import EnrichedChunk
 
+if TYPE_CHECKING:
+    from chromadb import Collection
+
+# Upper bound on document IDs in one $in filter, keeping each query and delete small
+_DELETE_FILTER_BATCH = 100
+
+# Vectors per upsert call. Chroma rejects calls above its client's max batch
+# size (5461 with the default SQLite backend), which a FILES_PER_BATCH group
+# can exceed; each call is still large enough to amortize its transaction.
+_UPSERT_BATCH_SIZE = 1000
+
 
 class ChromaVectorStoreRepository:
     """ChromaDB implementation of VectorStoreRepository.
@@ -11,13 +22,15 @@ class ChromaVectorStoreRepository:
     Wraps ChromaDB operations for vector storage and retrieval.
     """
 
-    def __init__(self, collection: Collection):
+    def __init__(self, collection: "Collection", upsert_batch_size: int = _UPSERT_BATCH_SIZE):
         """Initialize ChromaDB vector store.
 
         Args:
             collection: ChromaDB collection instance
+            upsert_batch_size: Maximum vectors written per upsert call
         """
         self._collection = collection
+        self._upsert_batch_size = max(1, upsert_batch_size)
 
     def upsert_chunks(self, chunks: list[EnrichedChunk]) -> None:
         """Store or update chunks in ChromaDB.
@@ -31,12 +44,23 @@ class ChromaVectorStoreRepository:
         if not chunks:
             return
 
-        self._collection.upsert(
-            ids=[c.chunk_id for c in chunks],
-            embeddings=[c.embedding for c in chunks],
-            metadatas=[c.metadata for c in chunks],
-            documents=[c.text for c in chunks],
-        )
+        # One pass over the chunks fills all four columns
+        ids, embeddings, metadatas, documents = [], [], [], []
+        for chunk in chunks:
+            ids.append(chunk.chunk_id)
+            embeddings.append(chunk.embedding)
+            metadatas.append(chunk.metadata)
+            documents.append(chunk.content)
+
+        step = self._upsert_batch_size
+        for start in range(0, len(ids), step):
+            end = start + step
+            self._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+                documents=documents[start:end],
+            )
 
     def delete_by_document_id(self, doc_id: str) -> int:
         """Delete all vectors for a document using metadata filter.
@@ -65,6 +89,50 @@ class ChromaVectorStoreRepository:
 
         return len(vector_ids)
 
+    def delete_by_document_ids(self, doc_ids: list[str]) -> dict[str, int]:
+        """Delete all vectors for several documents with one get and delete per 100 IDs.
+
+        Args:
+            doc_ids: Document IDs to delete all chunks for
+
+        Returns:
+            Number of vectors deleted per document ID (0 if it had none)
+
+        Raises:
+            Exception: If ChromaDB deletion fails
+        """
+        deleted = dict.fromkeys(doc_ids, 0)
+        deleted.pop("", None)
+        if not deleted:
+            return deleted
+
+        pending = list(deleted)
+        for start in range(0, len(pending), _DELETE_FILTER_BATCH):
+            batch = pending[start : start + _DELETE_FILTER_BATCH]
+            result = self._collection.get(
+                where={"document_id": {"$in": batch}},
+                include=["metadatas"],  # Needed to attribute IDs to documents
+            )
+            vector_ids = result.get("ids", [])
+
+            for metadata in result.get("metadatas") or []:
+                doc_id = metadata.get("document_id")
+                if doc_id in deleted:
+                    deleted[doc_id] += 1
+
+            if vector_ids:
+                self._collection.delete(ids=vector_ids)
+
+        return deleted
+
+    def ping(self) -> None:
+        """Check the collection is reachable with a single-ID, payload-free read.
+
+        Raises:
+            Exception: If ChromaDB cannot be reached
+        """
+        self._collection.get(limit=1, include=[])
+
     def count(self) -> int:
         """Get total count of vectors in ChromaDB collection.
 
@@ -0,0 +1,116 @@
+"""Content-addressed on-disk cache for embeddings.
+
+Forced re-runs, and documents whose edits touch only a few sections, send chunk
+texts to the API that it has already embedded. CachedEmbeddingProvider wraps
+any EmbeddingProvider and answers those from a SQLite table keyed by a hash of
+(model configuration, text), so only unseen texts cost an API call.
+
+Vectors are stored as packed float32. The OpenAI API returns float32 values,
+so the round trip is lossless at a quarter of the size of JSON text.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+
+from lovdata_pipeline.domain.embedding_provider import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+# Keys per SELECT ... IN (...) - well below SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+
+class CachedEmbeddingProvider:
+    """EmbeddingProvider decorator that reuses previously computed embeddings.
+
+    Safe to share between threads; SQLite access is serialized internally.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, cache_file: Path, namespace: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            provider: Provider used for texts that are not cached yet
+            cache_file: SQLite database file (created if missing)
+            namespace: Identifies the embedding configuration (model and dimensions).
+                Defaults to the provider's model name.
+        """
+        self._provider = provider
+        self._namespace = namespace or provider.get_model_name()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(cache_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key BLOB PRIMARY KEY, vector BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def _key(self, text: str) -> bytes:
+        """Hash a text together with the embedding configuration."""
+        return hashlib.sha256(f"{self._namespace}\0{text}".encode()).digest()
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts, calling the wrapped provider only for cache misses.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors (one per input text)
+
+        Raises:
+            Exception: If the wrapped provider fails
+        """
+        keys = [self._key(t) for t in texts]
+        vectors = self._lookup(keys)
+
+        # Each distinct unseen text is embedded once, even if repeated in the batch
+        missing = {k: t for k, t in zip(keys, texts, strict=True) if k not in vectors}
+        if missing:
+            fresh = self._provider.embed_batch(list(missing.values()))
+            rows = []
+            for key, vector in zip(missing, fresh, strict=True):
+                vectors[key] = vector
+                rows.append((key, array("f", vector).tobytes()))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+                )
+
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return [vectors[k] for k in keys]
+
+    def _lookup(self, keys: list[bytes]) -> dict[bytes, list[float]]:
+        """Fetch cached vectors for the given keys."""
+        found: dict[bytes, list[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start : start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def get_model_name(self) -> str:
+        """Get the wrapped provider's model identifier.
+
+        Returns:
+            Model name string
+        """
+        return self._provider.get_model_name()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._conn.close()
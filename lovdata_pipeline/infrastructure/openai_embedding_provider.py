@@ -1,4 +1,10 @@
-"""OpenAI embedding provider implementation."""
+"""OpenAI embedding provider implementation.
+
+Transient failures (429, 5xx, timeouts) are retried with exponential backoff by
+the OpenAI client itself (see PipelineOrchestrator.create). A batch the API
+rejects outright (400) is not retried: EmbeddingService keeps batches within
+the request limits, so a rejection is a configuration or input error.
+"""
 
 from openai import OpenAI
 
@@ -4,12 +4,16 @@ Just the essentials: sync datasets and query file changes.
 """
 
 import json
+import os
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from lovlig import Settings as LovligSettings
 from lovlig import sync_datasets
 
 from lovdata_pipeline.domain.models import (
+    FileScanSnapshot,
     LovligFileInfo,
     LovligRemovedFileInfo,
     LovligSyncStats,
@@ -31,6 +35,9 @@ class Lovlig:
         self.raw_dir = raw_dir
         self.extracted_dir = extracted_dir
         self.state_file = state_file
+        # Status partition of state.json keyed by (st_mtime_ns, st_size) of the
+        # file it came from. The parsed dict itself is not retained.
+        self._scan_cache: tuple[tuple[int, int], FileScanSnapshot] | None = None
 
     def sync(self, force: bool = False) -> LovligSyncStats:
         """Sync datasets from Lovdata.
@@ -45,6 +52,9 @@ class Lovlig:
             This syncs the raw datasets and updates lovlig's state.json.
             It does NOT update our pipeline_state.json - that happens during processing.
         """
+        # sync_datasets rewrites state.json
+        self._scan_cache = None
+
         settings = LovligSettings(
             dataset_filter=self.dataset_filter,
             raw_data_dir=self.raw_dir,
@@ -56,24 +66,100 @@ class Lovlig:
         sync_datasets(config=settings, force_download=force)
 
         # Return stats from the updated state
-        state = self._read_state()
-        stats = {"added": 0, "modified": 0, "removed": 0}
+        stats, _, _ = self.scan_state()
+        return stats
 
-        for dataset in state.get("raw_datasets", {}).values():
-            for file_info in dataset.get("files", {}).values():
-                status = file_info.get("status")
-                if status in stats:
-                    stats[status] += 1
+    def _read_state(self) -> tuple[tuple[int, int] | None, dict]:
+        """Read lovlig's state.json, unless the last scan already covers it.
 
-        return LovligSyncStats(**stats)
+        Returns:
+            Tuple of ((st_mtime_ns, st_size) cache key, parsed state). The state
+            is empty when the file is missing or the cached scan is still valid.
+        """
+        try:
+            with open(self.state_file, "rb") as f:
+                # fstat the open handle so the cache key matches the bytes we read
+                st = os.fstat(f.fileno())
+                key = (st.st_mtime_ns, st.st_size)
+                if self._scan_cache is not None and self._scan_cache[0] == key:
+                    return key, {}
+                data = f.read()
+        except FileNotFoundError:
+            return None, {}
+
+        # Parse straight from the raw buffer (no text-mode decode layer)
+        return key, json.loads(data)
+
+    def scan_state(
+        self,
+    ) -> tuple[LovligSyncStats, list[LovligFileInfo], list[LovligRemovedFileInfo]]:
+        """Partition state.json by file status in a single traversal.
 
-    def _read_state(self) -> dict:
-        """Read lovlig's state.json."""
-        if not self.state_file.exists():
-            return {}
+        Returns:
+            Tuple of (sync stats, changed files, removed files)
+        """
+        snapshot = self.scan()
+        return snapshot.stats, snapshot.changed, snapshot.removed
+
+    def scan(self) -> FileScanSnapshot:
+        """Walk state.json once, memoized for as long as the file is unchanged.
 
-        with open(self.state_file) as f:
-            return json.load(f)
+        Only the file records are kept; the parsed state goes out of scope once
+        the walk finishes, so large state files do not stay resident. Callers
+        must not mutate the returned lists; the getters below return copies.
+
+        Returns:
+            FileScanSnapshot with stats and changed, removed and all files
+        """
+        key, state = self._read_state()
+        if self._scan_cache is not None and self._scan_cache[0] == key:
+            return self._scan_cache[1]
+
+        changed: list[LovligFileInfo] = []
+        removed: list[LovligRemovedFileInfo] = []
+        all_files: list[LovligFileInfo] = []
+        changed_append = changed.append
+        removed_append = removed.append
+        all_append = all_files.append
+        counts = {"added": 0, "modified": 0, "removed": 0}
+
+        extracted_root = self.extracted_dir
+        # "status" is always serialized by lovlig's State models, so the hot
+        # loop indexes it directly; a dataset entry may lack "files"
+        raw_datasets = state.get("raw_datasets") or {}
+        for raw_name, dataset in raw_datasets.items():
+            files = dataset.get("files")
+            if not files:
+                continue
+
+            # Every file info of a dataset shares one interned name string
+            dataset_name = sys.intern(raw_name)
+            # One Path per dataset; per file only the final join allocates
+            dataset_base = extracted_root / dataset_name.removesuffix(".tar.bz2")
+
+            for rel_path, file_info in files.items():
+                status = file_info["status"]
+                if status in counts:
+                    counts[status] += 1
+
+                doc_id = _stem(rel_path)
+
+                if status == "removed":
+                    removed_append(LovligRemovedFileInfo(doc_id, dataset_name))
+                    continue
+
+                # Positional construction: (doc_id, path, dataset, hash)
+                info = LovligFileInfo(
+                    doc_id, dataset_base / rel_path, dataset_name, file_info.get("sha256", "")
+                )
+                all_append(info)
+                if status in ("added", "modified"):
+                    changed_append(info)
+
+        result = FileScanSnapshot(LovligSyncStats(**counts), changed, removed, all_files)
+        # A missing file is not cached so its later creation is picked up
+        self._scan_cache = (key, result) if key is not None else None
+        return result
 
     def get_changed_files(self) -> list[LovligFileInfo]:
         """Get files with status 'added' or 'modified'.
@@ -81,29 +167,19 @@ class Lovlig:
         Returns:
             List of LovligFileInfo objects for changed files
         """
-        state = self._read_state()
-        files = []
-
-        for dataset_name, dataset in state.get("raw_datasets", {}).items():
-            dataset_dir = dataset_name.replace(".tar.bz2", "")
+        return list(self.scan().changed)
 
-            for rel_path, file_info in dataset.get("files", {}).items():
-                status = file_info.get("status")
+    def iter_all_files(self) -> Iterator[LovligFileInfo]:
+        """Iterate over all files regardless of status without copying the scan.
 
-                if status in ("added", "modified"):
-                    abs_path = self.extracted_dir / dataset_dir / rel_path
-                    doc_id = Path(rel_path).stem
-
-                    files.append(
-                        LovligFileInfo(
-                            doc_id=doc_id,
-                            path=abs_path,
-                            hash=file_info.get("sha256", ""),
-                            dataset=dataset_name,
-                        )
-                    )
+        The scan is shared with the other getters and reused while state.json
+        is unchanged, so single-pass consumers pay for neither a second walk
+        nor a list copy.
 
-        return files
+        Yields:
+            LovligFileInfo objects for all non-removed files
+        """
+        yield from self.scan().all_files
 
     def get_all_files(self) -> list[LovligFileInfo]:
         """Get all files regardless of status.
@@ -111,29 +187,7 @@ class Lovlig:
         Returns:
             List of LovligFileInfo objects for all non-removed files
         """
-        state = self._read_state()
-        files = []
-
-        for dataset_name, dataset in state.get("raw_datasets", {}).items():
-            dataset_dir = dataset_name.replace(".tar.bz2", "")
-
-            for rel_path, file_info in dataset.get("files", {}).items():
-                # Include all files except removed ones
-                status = file_info.get("status")
-                if status != "removed":
-                    abs_path = self.extracted_dir / dataset_dir / rel_path
-                    doc_id = Path(rel_path).stem
-
-                    files.append(
-                        LovligFileInfo(
-                            doc_id=doc_id,
-                            path=abs_path,
-                            hash=file_info.get("sha256", ""),
-                            dataset=dataset_name,
-                        )
-                    )
-
-        return files
+        return list(self.iter_all_files())
 
     def get_removed_files(self) -> list[LovligRemovedFileInfo]:
         """Get files with status 'removed'.
@@ -141,13 +195,17 @@ class Lovlig:
         Returns:
             List of LovligRemovedFileInfo objects for removed files
         """
-        state = self._read_state()
-        files = []
+        return list(self.scan().removed)
+
 
-        for dataset_name, dataset in state.get("raw_datasets", {}).items():
-            for rel_path, file_info in dataset.get("files", {}).items():
-                if file_info.get("status") == "removed":
-                    doc_id = Path(rel_path).stem
-                    files.append(LovligRemovedFileInfo(doc_id=doc_id, dataset=dataset_name))
+def _stem(rel_path: str) -> str:
+    """Get the final component of a POSIX path without its suffix.
 
-        return files
+    Equivalent to ``Path(rel_path).stem`` without building a PurePath per file.
+    """
+    name = rel_path.rpartition("/")[2]
+    dot = name.rfind(".")
+    # Like pathlib, a leading or trailing dot does not start a suffix
+    if 0 < dot < len(name) - 1:
+        return name[:dot]
+    return name
@@ -5,46 +5,94 @@ Single Responsibility: Coordinate sync -> identify -> process -> cleanup stages.
 """
 
 import logging
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
 
-import chromadb
-from openai import OpenAI
-
-from lovdata_pipeline.domain.models import FileInfo, PipelineConfig, PipelineResult
+from lovdata_pipeline.domain.embedding_provider import EmbeddingProvider
+from lovdata_pipeline.domain.models import (
+    FileInfo,
+    FileProcessingResult,
+    PipelineConfig,
+    PipelineResult,
+)
 from lovdata_pipeline.domain.services.chunking_service import ChunkingService
 from lovdata_pipeline.domain.services.embedding_service import EmbeddingService
 from lovdata_pipeline.domain.services.file_processing_service import FileProcessingService
 from lovdata_pipeline.domain.vector_store import VectorStoreRepository
-from lovdata_pipeline.infrastructure.chroma_vector_store import ChromaVectorStoreRepository
 from lovdata_pipeline.infrastructure.jsonl_vector_store import JsonlVectorStoreRepository
-from lovdata_pipeline.infrastructure.openai_embedding_provider import OpenAIEmbeddingProvider
 from lovdata_pipeline.lovlig import Lovlig
 from lovdata_pipeline.progress import NoOpProgressTracker, ProgressTracker
 from lovdata_pipeline.state import ProcessingState
 
 logger = logging.getLogger(__name__)
 
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT_SECONDS = 60.0
+# Embedding request limits: OpenAI accepts up to 2048 inputs and 300k tokens
+# per request, so small chunks share a request and large ones are split early
+EMBEDDING_BATCH_SIZE = 512
+EMBEDDING_BATCH_TOKENS = 250_000
+# Default files between state snapshots; the journal covers the files in between
+STATE_SAVE_INTERVAL = 1000
+# Removed documents per vector store delete call
+DELETE_BATCH_SIZE = 100
+
 
 class PipelineOrchestrator:
     """Orchestrator for the complete pipeline execution.
 
     Single Responsibility: Coordinate the high-level pipeline stages
     (sync, identify, process, cleanup) using injected services.
+
+    Use it as a context manager (or call close()) to release the resources
+    it owns once no more runs follow.
     """
 
     def __init__(
         self,
         file_processor: FileProcessingService,
         vector_store: VectorStoreRepository,
+        max_workers: int = 1,
+        files_per_batch: int = 1,
+        checkpoint_every: int = STATE_SAVE_INTERVAL,
+        prefetch_groups: int = 1,
     ):
         """Initialize pipeline orchestrator.
 
         Args:
             file_processor: Service for processing individual files
             vector_store: Repository for vector storage operations
+            max_workers: Number of files processed concurrently (1 = sequential)
+            files_per_batch: Number of files whose chunks share embedding requests
+            checkpoint_every: Completed files between state snapshots
+            prefetch_groups: File groups chunked ahead when processing sequentially
         """
         self._file_processor = file_processor
         self._vector_store = vector_store
+        self._max_workers = max(1, max_workers)
+        self._files_per_batch = max(1, files_per_batch)
+        self._prefetch_groups = max(1, prefetch_groups)
+        self._checkpoint_every = max(1, checkpoint_every)
+        # Set once the vector store has answered; later runs skip the round-trip
+        self._validated = False
+        # Resources built by create() that close() releases
+        self._resources = ExitStack()
+
+    def __enter__(self) -> "PipelineOrchestrator":
+        """Enter a with block that closes the orchestrator on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the orchestrator."""
+        self.close()
+
+    def close(self) -> None:
+        """Release background chunking workers and resources opened by create()."""
+        self._file_processor.close()
+        self._resources.close()
 
     @classmethod
     def create(
@@ -59,6 +107,14 @@ class PipelineOrchestrator:
         chunk_min_tokens: int = 300,
         chunk_overlap_ratio: float = 0.15,
         embedding_dimensions: int | None = 1024,
+        jsonl_compress: bool = False,
+        chroma_upsert_batch_size: int = 1000,
+        max_workers: int = 1,
+        files_per_batch: int = 1,
+        embedding_concurrency: int = 1,
+        embedding_cache: bool = False,
+        chunk_processes: int = 0,
+        checkpoint_every: int = STATE_SAVE_INTERVAL,
     ) -> "PipelineOrchestrator":
         """Factory method to create a fully configured pipeline orchestrator.
 
@@ -73,28 +129,69 @@ class PipelineOrchestrator:
             chunk_min_tokens: Minimum tokens per chunk
             chunk_overlap_ratio: Overlap ratio between chunks
             embedding_dimensions: Embedding dimensions (1024 for storage efficiency)
+            jsonl_compress: Gzip-compress JSONL chunk files
+            chroma_upsert_batch_size: Maximum vectors per ChromaDB upsert call
+            max_workers: Number of files processed concurrently (1 = sequential)
+            files_per_batch: Number of files whose chunks share embedding requests
+            embedding_concurrency: Embedding requests in flight at once per file (or group)
+            embedding_cache: Reuse embeddings of previously seen chunk texts from disk
+            chunk_processes: Worker processes for chunking (0 = chunk in this process)
+            checkpoint_every: Completed files between state snapshots
 
         Returns:
             Configured PipelineOrchestrator instance
         """
-        # Create OpenAI client and embedding provider
-        openai_client = OpenAI(api_key=openai_api_key)
-        embedding_provider = OpenAIEmbeddingProvider(
+        # Heavy SDKs are imported here rather than at module level so importing
+        # the orchestrator (CLI startup, tests) does not pay for them, and
+        # chromadb is only loaded when Chroma storage is selected
+        from openai import OpenAI
+
+        from lovdata_pipeline.infrastructure.openai_embedding_provider import (
+            OpenAIEmbeddingProvider,
+        )
+
+        # Create OpenAI client and embedding provider. The SDK retries 429/5xx
+        # and timeouts with exponential backoff, so one transient error does not
+        # fail (and force re-embedding of) a whole document.
+        openai_client = OpenAI(
+            api_key=openai_api_key,
+            max_retries=OPENAI_MAX_RETRIES,
+            timeout=OPENAI_TIMEOUT_SECONDS,
+        )
+        embedding_provider: EmbeddingProvider = OpenAIEmbeddingProvider(
             openai_client, embedding_model, dimensions=embedding_dimensions
         )
+        if embedding_cache:
+            from lovdata_pipeline.infrastructure.embedding_cache import CachedEmbeddingProvider
+
+            embedding_provider = CachedEmbeddingProvider(
+                embedding_provider,
+                Path(data_dir) / "embedding_cache.sqlite",
+                namespace=f"{embedding_model}:{embedding_dimensions}",
+            )
 
         # Initialize vector store based on storage type
         if storage_type == "jsonl":
             jsonl_path = Path(data_dir) / "jsonl_chunks"
-            vector_store: VectorStoreRepository = JsonlVectorStoreRepository(jsonl_path)
+            vector_store: VectorStoreRepository = JsonlVectorStoreRepository(
+                jsonl_path, compress=jsonl_compress
+            )
             logger.info(f"Using JSONL storage at: {jsonl_path}")
         else:  # chroma (default)
+            import chromadb
+
+            from lovdata_pipeline.infrastructure.chroma_vector_store import (
+                ChromaVectorStoreRepository,
+            )
+
             chroma_client = chromadb.PersistentClient(path=chroma_path)
             collection = chroma_client.get_or_create_collection(
                 name="legal_docs",
                 metadata={"description": "Norwegian legal documents"},
             )
-            vector_store = ChromaVectorStoreRepository(collection)
+            vector_store = ChromaVectorStoreRepository(
+                collection, upsert_batch_size=chroma_upsert_batch_size
+            )
             logger.info(f"Using ChromaDB storage at: {chroma_path}")
 
         # Create domain services
@@ -104,14 +201,31 @@ class PipelineOrchestrator:
             min_tokens=chunk_min_tokens,
             overlap_ratio=chunk_overlap_ratio,
         )
-        embedding_service = EmbeddingService(provider=embedding_provider, batch_size=100)
+        embedding_service = EmbeddingService(
+            provider=embedding_provider,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            max_concurrent_requests=embedding_concurrency,
+            max_batch_tokens=EMBEDDING_BATCH_TOKENS,
+        )
         file_processor = FileProcessingService(
             chunking_service=chunking_service,
             embedding_service=embedding_service,
             vector_store=vector_store,
+            chunk_processes=chunk_processes,
         )
 
-        return cls(file_processor=file_processor, vector_store=vector_store)
+        orchestrator = cls(
+            file_processor=file_processor,
+            vector_store=vector_store,
+            max_workers=max_workers,
+            files_per_batch=files_per_batch,
+            checkpoint_every=checkpoint_every,
+            # Keep every chunking process busy while the current group embeds
+            prefetch_groups=max(1, chunk_processes),
+        )
+        if embedding_cache:
+            orchestrator._resources.callback(embedding_provider.close)
+        return orchestrator
 
     def run(
         self,
@@ -134,9 +248,11 @@ class PipelineOrchestrator:
         if progress_tracker is None:
             progress_tracker = NoOpProgressTracker()
 
-        # Initialize dependencies
-        lovlig = self._create_lovlig_client(config)
-        state = ProcessingState(config.data_dir / "pipeline_state.json")
+        # Initialize dependencies. Paths are derived from data_dir once per run
+        # and handed down rather than re-joined wherever they are needed.
+        data_dir = config.data_dir
+        lovlig = self._create_lovlig_client(config.dataset_filter, data_dir)
+        state = ProcessingState(data_dir / "pipeline_state.json")
 
         # Validate vector store connection
         self._validate_vector_store()
@@ -152,8 +268,12 @@ class PipelineOrchestrator:
             lovlig, state, config.force, progress_tracker, config.limit
         )
 
-        # Stage 3: Process files
-        processed, failed = self._process_files(to_process, state, progress_tracker)
+        # Stage 3: Process files. Chunking workers are stopped afterwards so an
+        # idle process pool does not outlive the run; the next run restarts it.
+        try:
+            processed, failed = self._process_files(to_process, state, progress_tracker)
+        finally:
+            self._file_processor.close()
 
         # Stage 4: Clean up removed files
         removed_count = self._cleanup_removed_files(removed, state, progress_tracker)
@@ -172,21 +292,25 @@ class PipelineOrchestrator:
             removed=removed_count,
         )
 
-    def _create_lovlig_client(self, config: PipelineConfig) -> Lovlig:
-        """Create and configure lovlig client."""
+    def _create_lovlig_client(self, dataset_filter: str, data_dir: Path) -> Lovlig:
+        """Create and configure lovlig client rooted at data_dir."""
         return Lovlig(
-            dataset_filter=config.dataset_filter,
-            raw_dir=config.data_dir / "raw",
-            extracted_dir=config.data_dir / "extracted",
-            state_file=config.data_dir / "state.json",
+            dataset_filter=dataset_filter,
+            raw_dir=data_dir / "raw",
+            extracted_dir=data_dir / "extracted",
+            state_file=data_dir / "state.json",
         )
 
     def _validate_vector_store(self) -> None:
-        """Validate that vector store is accessible."""
+        """Validate that vector store is accessible (once per orchestrator)."""
+        if self._validated:
+            return
         try:
-            self._vector_store.count()
+            # ping() rather than count(): counting can scan the whole index
+            self._vector_store.ping()
         except Exception as e:
             raise RuntimeError(f"Vector store connection failed: {e}") from e
+        self._validated = True
 
     def _sync_datasets(
         self,
@@ -242,37 +366,37 @@ class PipelineOrchestrator:
         """
         progress_tracker.start_stage("identify", "Identifying files")
 
-        changed = lovlig.get_changed_files()
+        # When forcing, consider ALL files (not just changed) and skip nothing.
+        # Otherwise use OUR pipeline_state.json to filter - this is the critical
+        # fix: only skip if WE have processed it with the same hash.
+        limited = limit is not None and limit > 0
         removed = lovlig.get_removed_files()
 
-        to_process = []
         if force:
-            # When forcing, process ALL files (not just changed)
-            all_files = lovlig.get_all_files()
-            to_process = [
-                FileInfo(doc_id=f.doc_id, path=f.path, dataset=f.dataset, hash=f.hash)
-                for f in all_files
-            ]
-            total_available = len(all_files)
+            # A limited forced run streams from the scan rather than copying
+            # the whole file list to keep its first few entries
+            pending: Iterable[FileInfo] = (
+                lovlig.iter_all_files() if limited else lovlig.get_all_files()
+            )
         else:
-            # Use OUR pipeline_state.json to filter - this is the critical fix
-            # Only skip if WE have processed it with the same hash
-            total_available = len(changed)
-            for f in changed:
-                if not state.is_processed(f.doc_id, f.hash):
-                    to_process.append(
-                        FileInfo(doc_id=f.doc_id, path=f.path, dataset=f.dataset, hash=f.hash)
-                    )
-
-        # Apply limit if specified
-        if limit is not None and limit > 0:
-            original_count = len(to_process)
-            to_process = to_process[:limit]
-            logger.info(f"Limit applied: processing {len(to_process)} of {original_count} files")
-
-        # Calculate skipped count correctly
-        skipped = total_available - len(to_process)
-        logger.debug(f"Processing {len(to_process)} files, skipped {skipped}")
+            candidates = lovlig.get_changed_files()
+            if len(candidates) < len(state.state.processed):
+                # Typical incremental run: probing a few files beats building a set
+                # over the whole processed history
+                is_processed = state.is_processed
+                pending = (f for f in candidates if not is_processed(f.doc_id, f.hash))
+            else:
+                processed = state.processed_pairs()
+                pending = (f for f in candidates if (f.doc_id, f.hash) not in processed)
+
+        # Apply limit if specified, stopping the filter as soon as it is reached
+        if limited:
+            to_process = list(islice(pending, limit))
+            logger.info(f"Limit applied: processing {len(to_process)} files")
+        else:
+            to_process = pending if isinstance(pending, list) else list(pending)
+            logger.debug(f"Processing {len(to_process)} files")
+
         progress_tracker.end_stage("identify")
 
         return to_process, removed
@@ -289,53 +413,170 @@ class PipelineOrchestrator:
         failed = 0
 
         if to_process:
-            progress_tracker.start_file_processing(len(to_process))
+            total = len(to_process)
+            progress_tracker.start_file_processing(total)
+
+            if self._max_workers > 1:
+                results = self._process_concurrently(to_process, progress_tracker)
+            else:
+                results = self._process_sequentially(to_process, progress_tracker)
+
+            # Bound once; these run per file
+            mark_processed = state.mark_processed
+            mark_failed = state.mark_failed
+            log_success = progress_tracker.log_success
+            log_error = progress_tracker.log_error
+            update_file = progress_tracker.update_file
+            concurrent = self._max_workers > 1
+            checkpoint_every = self._checkpoint_every
+
+            # State and progress updates stay on this thread, whichever way the
+            # files were processed
+            try:
+                for done, (file_info, result) in enumerate(results, 1):
+                    # Update state based on result (journaled, so each file is durable
+                    # without rewriting the whole snapshot)
+                    if result.success:
+                        mark_processed(file_info.doc_id, file_info.hash)
+                        processed += 1
+                        log_success(file_info.doc_id, result.chunk_count)
+                    else:
+                        error = result.error_message or "Unknown error"
+                        mark_failed(file_info.doc_id, file_info.hash, error)
+                        failed += 1
+                        log_error(file_info.doc_id, error)
+
+                    if concurrent:
+                        update_file(file_info.doc_id, done, total)
+
+                    # Periodically fold the journal into the snapshot so it stays short
+                    if done % checkpoint_every == 0:
+                        state.save()
+            finally:
+                # Fold the journal into the snapshot, even if processing was interrupted
+                state.save()
 
-            for idx, file_info in enumerate(to_process, 1):
-                # Update progress bar with current file
-                progress_tracker.update_file(file_info.doc_id, idx - 1, len(to_process))
+            # Complete the progress bar
+            progress_tracker.update_file("", len(to_process), len(to_process))
+            progress_tracker.end_file_processing()
 
-                # Create embedding progress callback
-                def embedding_progress(current: int, total: int):
-                    progress_tracker.update_embedding(current, total)
+        progress_tracker.end_stage("process")
+        return processed, failed
 
-                # Start embedding tracking
-                progress_tracker.start_embedding(0)  # Will be updated by callback
+    def _file_groups(self, to_process: list[FileInfo]) -> Iterator[list[FileInfo]]:
+        """Split files into groups that share embedding requests."""
+        size = self._files_per_batch
+        for start in range(0, len(to_process), size):
+            yield to_process[start : start + size]
 
-                # Process the file
-                result = self._file_processor.process_file(
-                    file_info,
-                    progress_callback=embedding_progress,
-                    warning_callback=progress_tracker.log_warning,
+    def _process_group(
+        self,
+        group: list[FileInfo],
+        progress_callback: Callable[[int, int], None] | None,
+        warning_callback: Callable[[str], None],
+    ) -> list[tuple[FileInfo, FileProcessingResult]]:
+        """Process a group of files, pooling embeddings when it holds several."""
+        if len(group) == 1:
+            results = [
+                self._file_processor.process_file(
+                    group[0],
+                    progress_callback=progress_callback,
+                    warning_callback=warning_callback,
                 )
+            ]
+        else:
+            results = self._file_processor.process_files(
+                group,
+                progress_callback=progress_callback,
+                warning_callback=warning_callback,
+            )
+        return list(zip(group, results, strict=True))
 
-                # End embedding tracking
-                progress_tracker.end_embedding()
-
-                # Update state based on result
-                if result.success:
-                    state.mark_processed(file_info.doc_id, file_info.hash)
-                    state.save()
-                    processed += 1
-                    progress_tracker.log_success(file_info.doc_id, result.chunk_count)
+    def _process_sequentially(
+        self,
+        to_process: list[FileInfo],
+        progress_tracker: ProgressTracker,
+    ) -> Iterator[tuple[FileInfo, FileProcessingResult]]:
+        """Process file groups one at a time, reporting embedding progress.
+
+        The next group(s) are chunked in the background while the current one
+        is embedded and indexed, so chunking stays off the critical path.
+        """
+        total = len(to_process)
+        groups = list(self._file_groups(to_process))
+        # Bound once; these run per group
+        update_file = progress_tracker.update_file
+        start_embedding = progress_tracker.start_embedding
+        end_embedding = progress_tracker.end_embedding
+        log_warning = progress_tracker.log_warning
+        process_group = self._process_group
+        prefetch = self._file_processor.prefetch
+        # The tracker method already has the callback(current, total) signature
+        embedding_progress = progress_tracker.update_embedding
+
+        depth = self._prefetch_groups
+
+        done = 0
+        try:
+            for index, group in enumerate(groups):
+                # Start with the first `depth` upcoming groups, then top up by one
+                if index == 0:
+                    upcoming = groups[1 : 1 + depth]
                 else:
-                    state.mark_failed(
-                        file_info.doc_id,
-                        file_info.hash,
-                        result.error_message or "Unknown error",
-                    )
-                    state.save()
-                    failed += 1
-                    progress_tracker.log_error(
-                        file_info.doc_id, result.error_message or "Unknown error"
-                    )
+                    upcoming = groups[index + depth : index + depth + 1]
+                for ahead in upcoming:
+                    prefetch(ahead)
 
-            # Complete the progress bar
-            progress_tracker.update_file("", len(to_process), len(to_process))
-            progress_tracker.end_file_processing()
+                # Update progress bar with current file
+                update_file(group[0].doc_id, done, total)
 
-        progress_tracker.end_stage("process")
-        return processed, failed
+                # Start embedding tracking
+                start_embedding(0)  # Will be updated by callback
+
+                # Process the file(s)
+                results = process_group(group, embedding_progress, log_warning)
+
+                # End embedding tracking
+                end_embedding()
+
+                done += len(group)
+                yield from results
+        finally:
+            # An interrupted run leaves the next group's chunks unclaimed
+            self._file_processor.cancel_prefetch()
+
+    def _process_concurrently(
+        self,
+        to_process: list[FileInfo],
+        progress_tracker: ProgressTracker,
+    ) -> Iterator[tuple[FileInfo, FileProcessingResult]]:
+        """Process file groups on a thread pool, yielding results as they complete.
+
+        File processing is dominated by disk reads and embedding API round-trips,
+        which release the GIL. Per-file embedding progress is not reported since
+        several files are in flight at once.
+
+        Only a window of twice the worker count is submitted at a time and
+        refilled as groups finish, so pending futures stay bounded for large
+        runs and an interrupted run only waits for the groups already queued.
+        """
+        groups = self._file_groups(to_process)
+        log_warning = progress_tracker.log_warning
+        window = 2 * self._max_workers
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+
+            def submit(group: list[FileInfo]) -> Future:
+                return executor.submit(self._process_group, group, None, log_warning)
+
+            in_flight = {submit(group) for group in islice(groups, window)}
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                # Refill before handing results back so workers stay busy while
+                # the caller records them
+                in_flight.update(submit(group) for group in islice(groups, len(done)))
+                for future in done:
+                    yield from future.result()
 
     def _cleanup_removed_files(
         self,
@@ -350,20 +591,38 @@ class PipelineOrchestrator:
         progress_tracker.start_stage("cleanup", "Cleaning up removed documents")
         removed_count = 0
 
-        for r in removed:
-            doc_id = r.doc_id
+        doc_ids = [r.doc_id for r in removed]
+        batches = [
+            doc_ids[start : start + DELETE_BATCH_SIZE]
+            for start in range(0, len(doc_ids), DELETE_BATCH_SIZE)
+        ]
 
-            # Delete all chunks for this document using metadata filter
+        def delete(batch: list[str]) -> dict[str, int]:
             try:
-                deleted = self._vector_store.delete_by_document_id(doc_id)
-                if deleted > 0:
-                    logger.debug(f"Deleted {deleted} chunks for {doc_id}")
-                    removed_count += 1
-                else:
-                    # Document was tracked but had no vectors (maybe never fully processed)
-                    logger.debug(f"No chunks found for {doc_id}")
+                return self._vector_store.delete_by_document_ids(batch)
             except Exception as e:
-                progress_tracker.log_warning(f"Failed to delete chunks for {doc_id}: {e}")
+                progress_tracker.log_warning(f"Failed to delete chunks for removed documents: {e}")
+                return {}
+
+        # Delete all chunks for the removed documents in batches, overlapping
+        # the store round-trips when running with several workers
+        deleted_by_doc: dict[str, int] = {}
+        if self._max_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(batches))) as executor:
+                for batch_deleted in executor.map(delete, batches):
+                    deleted_by_doc.update(batch_deleted)
+        else:
+            for batch in batches:
+                deleted_by_doc.update(delete(batch))
+
+        for doc_id in doc_ids:
+            deleted = deleted_by_doc.get(doc_id, 0)
+            if deleted > 0:
+                logger.debug(f"Deleted {deleted} chunks for {doc_id}")
+                removed_count += 1
+            else:
+                # Document was tracked but had no vectors (maybe never fully processed)
+                logger.debug(f"No chunks found for {doc_id}")
 
             state.remove(doc_id)
 
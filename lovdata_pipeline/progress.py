@@ -6,6 +6,7 @@ progress bar implementations.
 """
 
 import logging
+import time
 from typing import Any, Protocol
 
 from rich.console import Console
@@ -19,6 +20,10 @@ from rich.progress import (
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between intermediate progress updates; Rich redraws at ~10 Hz
+# anyway, so more frequent updates only cost time in the processing loop
+_UPDATE_INTERVAL = 0.1
+
 
 class ProgressTracker(Protocol):
     """Protocol for progress tracking implementations.
@@ -135,6 +140,8 @@ class RichProgressTracker:
     """Progress tracker using Rich library for beautiful progress bars.
 
     Provides multi-level progress tracking with automatic lifecycle management.
+    The embedding display is started once per processing stage and reused for
+    every file, and intermediate updates are throttled to the redraw rate.
     """
 
     def __init__(self, console: Console | None = None):
@@ -145,6 +152,8 @@ class RichProgressTracker:
         self.current_stage: str | None = None
         self._file_task_id: Any | None = None
         self._embedding_task_id: Any | None = None
+        self._last_file_update = 0.0
+        self._last_embedding_update = 0.0
 
     def _get_or_create_progress(self, attr_name: str, create_fn: callable) -> tuple[Progress, bool]:
         """Get existing progress or create new one. Returns (progress, was_created)."""
@@ -192,6 +201,10 @@ class RichProgressTracker:
     def update_file(self, doc_id: str, current: int, total: int) -> None:
         """Update progress for current file being processed."""
         if self._file_progress and self._file_task_id is not None:
+            now = time.monotonic()
+            if current < total and now - self._last_file_update < _UPDATE_INTERVAL:
+                return
+            self._last_file_update = now
             self._file_progress.update(
                 self._file_task_id,
                 completed=current,
@@ -203,6 +216,7 @@ class RichProgressTracker:
         if self._file_progress and self._file_task_id is not None:
             self._file_progress.update(self._file_task_id, visible=False)
         self._cleanup_progress("_file_progress", "_file_task_id")
+        self._cleanup_progress("_embedding_progress", "_embedding_task_id")
 
     def start_embedding(self, total_chunks: int) -> None:
         """Start tracking embedding progress within a file."""
@@ -215,11 +229,28 @@ class RichProgressTracker:
                 transient=False,
             ),
         )
-        self._embedding_task_id = progress.add_task("[yellow]  └─ Embedding chunks", total=None)
+        if self._embedding_task_id is None:
+            self._embedding_task_id = progress.add_task("[yellow]  └─ Embedding chunks", total=None)
+        else:
+            # Reuse the live display and task from the previous file
+            progress.reset(
+                self._embedding_task_id,
+                total=None,
+                description="[yellow]  └─ Embedding chunks",
+                visible=True,
+            )
+        self._last_embedding_update = 0.0
 
     def update_embedding(self, chunks_embedded: int, total_chunks: int) -> None:
         """Update embedding progress."""
         if self._embedding_progress and self._embedding_task_id is not None:
+            now = time.monotonic()
+            if (
+                chunks_embedded < total_chunks
+                and now - self._last_embedding_update < _UPDATE_INTERVAL
+            ):
+                return
+            self._last_embedding_update = now
             self._embedding_progress.update(
                 self._embedding_task_id,
                 completed=chunks_embedded,
@@ -228,10 +259,12 @@ class RichProgressTracker:
             )
 
     def end_embedding(self) -> None:
-        """End embedding progress tracking."""
+        """End embedding progress tracking for the current file.
+
+        The display stays live for the next file; end_file_processing stops it.
+        """
         if self._embedding_progress and self._embedding_task_id is not None:
-            self._embedding_progress.remove_task(self._embedding_task_id)
-        self._cleanup_progress("_embedding_progress", "_embedding_task_id")
+            self._embedding_progress.update(self._embedding_task_id, visible=False)
 
     def log_success(self, doc_id: str, chunk_count: int) -> None:
         """Log successful processing of a document."""
@@ -11,10 +11,29 @@ Why separate?
 - If lovlig syncs again before processing completes, state.json gets overwritten
 - pipeline_state.json preserves our processing history
 - We always check pipeline_state.json to determine what needs processing
+
+Durability:
+Each transition (processed/failed/removed) is appended as one JSON line to
+pipeline_state.journal instead of rewriting the whole snapshot. save() folds
+the journal into pipeline_state.json and truncates it; on load, any journal
+entries newer than the snapshot are replayed on top of it. A long journal, or
+one ending in a torn write, is compacted into the snapshot right after loading
+so startup replay stays short and new entries never land behind a torn line.
+
+Journal appends and snapshot writes are serialized across processes with an
+exclusive flock on pipeline_state.lock, and across threads sharing a tracker
+with a reentrant lock. save() reloads the snapshot first if another writer has
+replaced it, so concurrent runs never overwrite each other's records. Use
+update() for read-modify-write cycles that must see other writers' changes.
 """
 
+import fcntl
 import json
-from datetime import UTC, datetime
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from lovdata_pipeline.domain.models import (
@@ -22,6 +41,7 @@ from lovdata_pipeline.domain.models import (
     ProcessedDocumentInfo,
     ProcessingStateData,
 )
+from lovdata_pipeline.utils.file_ops import atomic_write_bytes
 
 
 class ProcessingState:
@@ -35,71 +55,292 @@ class ProcessingState:
     by document_id metadata filter and reprocess from scratch.
     """
 
-    def __init__(self, state_file: Path):
-        """Initialize state tracker."""
+    def __init__(self, state_file: Path, sync_every: int = 32, compact_after: int = 10_000):
+        """Initialize state tracker.
+
+        Args:
+            state_file: Path to the pipeline_state.json snapshot
+            sync_every: Number of journal entries between fsyncs (group commit)
+            compact_after: Replayed journal entries that trigger compaction on load
+        """
         self.state_file = state_file
+        self.journal_file = state_file.with_suffix(".journal")
+        self.lock_file = state_file.with_suffix(".lock")
+        self._sync_every = max(1, sync_every)
+        self._journal = None
+        self._unsynced = 0
+        self._lock_handle = None
+        self._lock_depth = 0
+        # Serializes threads sharing this tracker; flock does not, as they share the fd
+        self._thread_lock = threading.RLock()
+        # (st_ino, st_mtime_ns) of the snapshot as last loaded or written here
+        self._snapshot_id: tuple[int, int] | None = None
+        # True when memory holds transitions not yet in the snapshot
+        self._dirty = False
+        # (doc_id, hash) membership set for bulk filtering, rebuilt on demand
+        self._processed_pairs: frozenset[tuple[str, str]] | None = None
         self.state = self._load()
+        replayed, torn = self._replay_journal()
+        if torn or replayed >= compact_after:
+            self.save()
 
     def _load(self) -> ProcessingStateData:
-        """Load state from disk."""
+        """Load state snapshot from disk.
+
+        Raises:
+            ValueError: If the snapshot is valid JSON but holds malformed records
+        """
         if not self.state_file.exists():
             return ProcessingStateData()
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
-                # Convert dict format to Pydantic models
-                return ProcessingStateData(
-                    processed={
-                        k: ProcessedDocumentInfo(**v) for k, v in data.get("processed", {}).items()
-                    },
-                    failed={k: FailedDocumentInfo(**v) for k, v in data.get("failed", {}).items()},
-                )
+            with open(self.state_file, "rb") as f:
+                st = os.fstat(f.fileno())
+                self._snapshot_id = (st.st_ino, st.st_mtime_ns)
+                data = json.loads(f.read())
         except (json.JSONDecodeError, OSError):
             return ProcessingStateData()
 
+        try:
+            # Timestamps stay the ISO strings they were saved as: parsing them
+            # here and formatting them again on save dominated both paths, and
+            # untouched entries are written back unchanged
+            return ProcessingStateData(
+                processed={
+                    k: ProcessedDocumentInfo(hash=v["hash"], at=v["at"])
+                    for k, v in data.get("processed", {}).items()
+                },
+                failed={
+                    k: FailedDocumentInfo(hash=v["hash"], error=v["error"], at=v["at"])
+                    for k, v in data.get("failed", {}).items()
+                },
+            )
+        except (AttributeError, KeyError, TypeError) as e:
+            # Starting empty here would let the next save() wipe every record
+            raise ValueError(f"Malformed pipeline state in {self.state_file}: {e!r}") from e
+
+    def _replay_journal(self) -> tuple[int, bool]:
+        """Apply journal entries written since the last snapshot.
+
+        Returns:
+            Tuple of (entries applied, whether the journal ended in a torn write)
+
+        Raises:
+            ValueError: If an undecodable entry is followed by further entries
+        """
+        if not self.journal_file.exists():
+            return 0, False
+
+        replayed = 0
+        try:
+            with open(self.journal_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        if f.read().strip():
+                            raise ValueError(
+                                f"Corrupt entry {replayed + 1} in {self.journal_file}"
+                            ) from e
+                        # Torn trailing write from a crash - everything before it is intact
+                        return replayed, True
+                    self._apply(entry)
+                    replayed += 1
+        except OSError:
+            pass
+        return replayed, False
+
+    def _apply(self, entry: dict):
+        """Apply a single journal entry to the in-memory state."""
+        op = entry["op"]
+        doc_id = entry["doc_id"]
+        self._dirty = True
+        self._processed_pairs = None
+        if op == "processed":
+            self.state.processed[doc_id] = ProcessedDocumentInfo(hash=entry["hash"], at=entry["at"])
+            self.state.failed.pop(doc_id, None)
+        elif op == "failed":
+            self.state.failed[doc_id] = FailedDocumentInfo(
+                hash=entry["hash"], error=entry["error"], at=entry["at"]
+            )
+            # Failed reprocessing deletes the document's chunks, so an older
+            # processed entry no longer describes what is in the store
+            self.state.processed.pop(doc_id, None)
+        elif op == "removed":
+            self.state.processed.pop(doc_id, None)
+            self.state.failed.pop(doc_id, None)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the state across processes and threads (reentrant)."""
+        with self._thread_lock:
+            if self._lock_handle is None:
+                self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+                self._lock_handle = open(self.lock_file, "a")  # noqa: SIM115
+
+            if self._lock_depth == 0:
+                fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_UN)
+
+    def _reload(self) -> None:
+        """Replace in-memory state with the snapshot plus journal (caller holds the lock)."""
+        self.close()
+        self._dirty = False
+        self._snapshot_id = None
+        self.state = self._load()
+        self._processed_pairs = None
+        self._replay_journal()
+
+    def _snapshot_changed(self) -> bool:
+        """Check whether another writer replaced the snapshot since we last saw it."""
+        try:
+            st = self.state_file.stat()
+        except FileNotFoundError:
+            return self._snapshot_id is not None
+        return (st.st_ino, st.st_mtime_ns) != self._snapshot_id
+
+    @contextmanager
+    def update(self) -> Iterator["ProcessingState"]:
+        """Reload from disk, apply changes and save, all under the state lock.
+
+        Discards stale in-memory state so concurrent writers never lose each
+        other's updates.
+
+        Yields:
+            This state tracker, freshly reloaded
+        """
+        with self._locked():
+            self._reload()
+            yield self
+            self.save()
+
+    def _append(self, entry: dict):
+        """Append an entry to the journal, fsyncing every ``sync_every`` entries."""
+        with self._locked():
+            if self._journal is not None and os.fstat(self._journal.fileno()).st_nlink == 0:
+                # Another writer folded the journal into a snapshot - start a new one
+                self._journal.close()
+                self._journal = None
+            if self._journal is None:
+                self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_file, "a", encoding="utf-8")  # noqa: SIM115
+
+            self._journal.write(json.dumps(entry) + "\n")
+            self._journal.flush()
+        self._unsynced += 1
+        if self._unsynced >= self._sync_every:
+            self._sync_journal()
+
+    def _sync_journal(self):
+        """Force buffered journal entries to stable storage."""
+        if self._journal is not None and self._unsynced:
+            getattr(os, "fdatasync", os.fsync)(self._journal.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        """Sync and close the journal without writing a snapshot."""
+        if self._journal is not None:
+            self._sync_journal()
+            self._journal.close()
+            self._journal = None
+
     def save(self):
-        """Save state to disk atomically."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        """Save state snapshot to disk atomically and truncate the journal.
+
+        Skipped when nothing changed since the last snapshot. If another writer
+        replaced the snapshot since this tracker loaded or wrote it, the new
+        snapshot is reloaded first. Every transition, ours included, is in it
+        or in the journal, so writing stale memory over it would lose records.
+        """
+        with self._locked():
+            if self._snapshot_changed():
+                self._reload()
+            else:
+                # Pick up transitions journaled by other writers since we loaded
+                self._replay_journal()
+            if self._dirty or not self.state_file.exists():
+                self._write_snapshot()
 
-        # Convert Pydantic models to dict for JSON serialization
+    def _write_snapshot(self):
+        """Write the snapshot and drop the journal (caller holds the lock)."""
+        # Build plain dicts directly - model_dump() walks the schema per entry,
+        # which dominates save time for large states. Only timestamps of
+        # entries created since the load need formatting here.
         data = {
-            "processed": {k: v.model_dump() for k, v in self.state.processed.items()},
-            "failed": {k: v.model_dump() for k, v in self.state.failed.items()},
+            "processed": {
+                k: {"hash": v.hash, "at": v.at_iso} for k, v in self.state.processed.items()
+            },
+            "failed": {
+                k: {"hash": v.hash, "error": v.error, "at": v.at_iso}
+                for k, v in self.state.failed.items()
+            },
         }
 
-        # Atomic write
-        tmp = self.state_file.with_suffix(".tmp")
-        with open(tmp, "w") as f:
-            json.dump(data, f, indent=2)
-        tmp.replace(self.state_file)
+        # Compact single-pass encode; indentation roughly doubles the file size
+        payload = json.dumps(data, separators=(",", ":")).encode()
+
+        # Atomic, fsynced write. The snapshot must be on disk before the
+        # journal it replaces is dropped, or a crash could lose both.
+        atomic_write_bytes(self.state_file, payload)
+        st = self.state_file.stat()
+        self._snapshot_id = (st.st_ino, st.st_mtime_ns)
+
+        # Snapshot now contains every journaled transition
+        self.close()
+        self.journal_file.unlink(missing_ok=True)
+        self._dirty = False
 
     def is_processed(self, doc_id: str, file_hash: str) -> bool:
         """Check if document already processed with this hash."""
-        if doc_id not in self.state.processed:
-            return False
-        return self.state.processed[doc_id].hash == file_hash
+        # Single O(1) lookup on the doc_id-keyed dict
+        info = self.state.processed.get(doc_id)
+        return info is not None and info.hash == file_hash
+
+    def processed_pairs(self) -> frozenset[tuple[str, str]]:
+        """Get (doc_id, hash) pairs of processed documents for bulk membership tests.
+
+        The set is cached until the next state transition.
+        """
+        if self._processed_pairs is None:
+            self._processed_pairs = frozenset(
+                (doc_id, info.hash) for doc_id, info in self.state.processed.items()
+            )
+        return self._processed_pairs
 
     def mark_processed(self, doc_id: str, file_hash: str):
         """Mark document as successfully processed."""
-        self.state.processed[doc_id] = ProcessedDocumentInfo(
-            hash=file_hash,
-            at=datetime.now(UTC).isoformat(),
-        )
-        self.state.failed.pop(doc_id, None)
+        entry = {
+            "op": "processed",
+            "doc_id": doc_id,
+            "hash": file_hash,
+            "at": time.time_ns(),
+        }
+        self._apply(entry)
+        self._append(entry)
 
     def mark_failed(self, doc_id: str, file_hash: str, error: str):
-        """Mark document as failed."""
-        self.state.failed[doc_id] = FailedDocumentInfo(
-            hash=file_hash,
-            error=error,
-            at=datetime.now(UTC).isoformat(),
-        )
+        """Mark document as failed (a document is never both processed and failed)."""
+        entry = {
+            "op": "failed",
+            "doc_id": doc_id,
+            "hash": file_hash,
+            "error": error,
+            "at": time.time_ns(),
+        }
+        self._apply(entry)
+        self._append(entry)
 
     def remove(self, doc_id: str):
         """Remove document from state."""
-        self.state.processed.pop(doc_id, None)
-        self.state.failed.pop(doc_id, None)
+        entry = {"op": "removed", "doc_id": doc_id}
+        self._apply(entry)
+        self._append(entry)
 
     def stats(self) -> dict:
         """Get summary statistics."""
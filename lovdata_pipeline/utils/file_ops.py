@@ -1,17 +1,36 @@
 """File operation utilities for atomic writes and safe file handling.
 
-NOTE: This module is currently UNUSED in the codebase.
-State.py implements its own atomic write logic inline.
-Consider removing if not needed or consolidating atomic write logic here.
-
 This module provides utilities for safely writing files atomically to prevent
 corruption from partial writes or crashes.
 """
 
 import json
+import os
 from pathlib import Path
 
 
+def atomic_write_bytes(file_path: Path, payload: bytes) -> None:
+    """Write bytes to file atomically using temp file + fsync + rename.
+
+    The payload is flushed to disk before the rename, so after a crash the
+    target holds either the old or the new content in full.
+
+    Args:
+        file_path: Path to the target file
+        payload: Bytes to write
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_file = file_path.with_suffix(".tmp")
+    with open(temp_file, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Atomic rename (overwrites target file)
+    os.replace(temp_file, file_path)
+
+
 def atomic_write_json(
     file_path: Path,
     data: dict,
@@ -35,13 +54,5 @@ def atomic_write_json(
         >>> from pathlib import Path
         >>> atomic_write_json(Path("config.json"), {"key": "value"})
     """
-    # Ensure parent directory exists
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to temporary file
-    temp_file = file_path.with_suffix(".tmp")
-    with open(temp_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii, **json_kwargs)
-
-    # Atomic rename (overwrites target file)
-    temp_file.replace(file_path)
+    payload = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, **json_kwargs)
+    atomic_write_bytes(file_path, payload.encode("utf-8"))
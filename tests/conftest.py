@@ -73,6 +73,7 @@ def mock_vector_store():
     store = Mock(spec=VectorStoreRepository)
     store.count.return_value = 0
     store.delete_by_document_id.return_value = 5
+    store.delete_by_document_ids.side_effect = lambda doc_ids: dict.fromkeys(doc_ids, 5)
     return store
 
 
@@ -86,6 +87,7 @@ def mock_lovlig(tmp_path):
     lovlig.get_changed_files.return_value = []
     lovlig.get_removed_files.return_value = []
     lovlig.get_all_files.return_value = []
+    lovlig.iter_all_files.side_effect = lambda: iter(lovlig.get_all_files.return_value)
     lovlig.sync.return_value = LovligSyncStats(
         added=0,
         modified=0,
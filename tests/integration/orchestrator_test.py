@@ -187,6 +187,30 @@ class TestPipelineOrchestrator:
         assert mock_file_processor.process_file.call_count == 2
         assert result.processed == 2
 
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_force_with_limit_streams_files(
+        self, mock_lovlig_class, orchestrator, pipeline_config, mock_lovlig, mock_file_processor
+    ):
+        """Test a limited forced run takes its files from the scan without copying it."""
+        mock_lovlig_class.return_value = mock_lovlig
+        mock_lovlig.get_all_files.return_value = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(5)
+        ]
+        pipeline_config.force = True
+        pipeline_config.limit = 2
+
+        result = orchestrator.run(pipeline_config)
+
+        assert result.processed == 2
+        mock_lovlig.iter_all_files.assert_called_once()
+        mock_lovlig.get_all_files.assert_not_called()
+
     @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
     def test_orchestrator_handles_processing_failures(
         self, mock_lovlig_class, orchestrator, pipeline_config, mock_lovlig, mock_file_processor
@@ -284,7 +308,7 @@ class TestPipelineOrchestrator:
         result = orchestrator.run(pipeline_config)
 
         # Verify vector store cleanup was called
-        mock_vector_store.delete_by_document_id.assert_called_once_with("doc1")
+        mock_vector_store.delete_by_document_ids.assert_called_once_with(["doc1"])
         assert result.removed == 1
 
         # Verify file was removed from state
@@ -326,11 +350,23 @@ class TestPipelineOrchestrator:
         mock_lovlig_class.return_value = mock_lovlig
 
         # Make vector store connection fail
-        mock_vector_store.count.side_effect = RuntimeError("Connection failed")
+        mock_vector_store.ping.side_effect = RuntimeError("Connection failed")
 
         with pytest.raises(RuntimeError, match="Vector store connection failed"):
             orchestrator.run(pipeline_config)
 
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_validates_vector_store_once(
+        self, mock_lovlig_class, orchestrator, pipeline_config, mock_lovlig, mock_vector_store
+    ):
+        """Test repeated runs reuse a successful vector store validation."""
+        mock_lovlig_class.return_value = mock_lovlig
+
+        orchestrator.run(pipeline_config)
+        orchestrator.run(pipeline_config)
+
+        mock_vector_store.ping.assert_called_once()
+
     @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
     def test_orchestrator_validates_lovlig_state_created(
         self, mock_lovlig_class, orchestrator, pipeline_config, mock_lovlig, tmp_path
@@ -440,10 +476,288 @@ class TestPipelineOrchestrator:
         ]
 
         # Make vector store deletion fail
-        mock_vector_store.delete_by_document_id.side_effect = Exception("Delete failed")
+        mock_vector_store.delete_by_document_ids.side_effect = Exception("Delete failed")
 
         # Should not raise, but log warning
         result = orchestrator.run(pipeline_config)
 
         # Pipeline should continue despite deletion error
         assert isinstance(result.removed, int)
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_processes_files_concurrently(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test orchestrator with a thread pool records every file's outcome."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            max_workers=4,
+        )
+
+        mock_lovlig.get_changed_files.return_value = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(10)
+        ]
+
+        def process(file_info, **kwargs):
+            success = file_info.doc_id != "doc3"
+            return FileProcessingResult(
+                success=success,
+                chunk_count=1 if success else 0,
+                error_message=None if success else "Error",
+            )
+
+        mock_file_processor.process_file.side_effect = process
+
+        result = orchestrator.run(pipeline_config)
+
+        assert result.processed == 9
+        assert result.failed == 1
+        state = ProcessingState(pipeline_config.data_dir / "pipeline_state.json")
+        assert len(state.state.processed) == 9
+        assert "doc3" in state.state.failed
+
+    def test_concurrent_processing_bounds_queued_files(
+        self, mock_file_processor, mock_vector_store
+    ):
+        """Test only a window of files is queued ahead of the results consumed."""
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            max_workers=2,
+        )
+        files = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(20)
+        ]
+
+        results = orchestrator._process_concurrently(files, Mock())
+        next(results)
+
+        # Window of 4, refilled once for the groups in the first completed batch
+        assert mock_file_processor.process_file.call_count <= 8
+        assert len(list(results)) == 19
+        assert mock_file_processor.process_file.call_count == 20
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_saves_state_when_processing_is_interrupted(
+        self, mock_lovlig_class, orchestrator, pipeline_config, mock_lovlig, mock_file_processor
+    ):
+        """Test orchestrator snapshots completed files even if a later file raises."""
+        mock_lovlig_class.return_value = mock_lovlig
+
+        mock_lovlig.get_changed_files.return_value = [
+            LovligFileInfo(
+                doc_id="doc1",
+                path=Path("/data/doc1.xml"),
+                hash="hash1",
+                dataset="test",
+            ),
+            LovligFileInfo(
+                doc_id="doc2",
+                path=Path("/data/doc2.xml"),
+                hash="hash2",
+                dataset="test",
+            ),
+        ]
+        mock_file_processor.process_file.side_effect = [
+            FileProcessingResult(success=True, chunk_count=3, error_message=None),
+            KeyboardInterrupt(),
+        ]
+
+        with pytest.raises(KeyboardInterrupt):
+            orchestrator.run(pipeline_config)
+
+        state_file = pipeline_config.data_dir / "pipeline_state.json"
+        assert not state_file.with_suffix(".journal").exists()
+        assert "doc1" in ProcessingState(state_file).state.processed
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_groups_files_for_shared_embedding(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test orchestrator hands files to the processor in groups when batching."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            files_per_batch=2,
+        )
+
+        mock_lovlig.get_changed_files.return_value = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(3)
+        ]
+        mock_file_processor.process_files.side_effect = lambda group, **kwargs: [
+            FileProcessingResult(success=True, chunk_count=1) for _ in group
+        ]
+
+        result = orchestrator.run(pipeline_config)
+
+        assert result.processed == 3
+        # Two files pooled, the remainder processed alone
+        assert mock_file_processor.process_files.call_count == 1
+        assert mock_file_processor.process_file.call_count == 1
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_prefetches_next_group(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test each file after the first is prefetched while its predecessor is processed."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+        )
+
+        files = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(3)
+        ]
+        mock_lovlig.get_changed_files.return_value = files
+
+        orchestrator.run(pipeline_config)
+
+        prefetched = [c.args[0] for c in mock_file_processor.prefetch.call_args_list]
+        assert prefetched == [[files[1]], [files[2]]]
+        mock_file_processor.cancel_prefetch.assert_called_once()
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_closes_file_processor_after_processing(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test chunking workers are stopped after a run, even one that raises."""
+        mock_lovlig_class.return_value = mock_lovlig
+        mock_lovlig.get_changed_files.return_value = [
+            LovligFileInfo(doc_id="doc", path=Path("/data/doc.xml"), hash="h", dataset="test")
+        ]
+        mock_file_processor.process_file.side_effect = KeyboardInterrupt
+
+        with PipelineOrchestrator(
+            file_processor=mock_file_processor, vector_store=mock_vector_store
+        ) as orchestrator:
+            with pytest.raises(KeyboardInterrupt):
+                orchestrator.run(pipeline_config)
+            mock_file_processor.close.assert_called_once()
+
+        assert mock_file_processor.close.call_count == 2
+
+    def test_orchestrator_close_releases_embedding_cache(self, tmp_path):
+        """Test closing a created orchestrator closes the embedding cache once."""
+        from lovdata_pipeline.infrastructure.embedding_cache import CachedEmbeddingProvider
+
+        with patch.object(CachedEmbeddingProvider, "close") as mock_close:
+            with PipelineOrchestrator.create(
+                openai_api_key="test-key",
+                embedding_model="test-model",
+                chunk_max_tokens=512,
+                storage_type="jsonl",
+                data_dir=str(tmp_path),
+                embedding_cache=True,
+            ) as orchestrator:
+                mock_close.assert_not_called()
+            orchestrator.close()
+
+        mock_close.assert_called_once()
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_prefetches_several_groups_ahead(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test each upcoming group is prefetched once, up to prefetch_groups ahead."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            prefetch_groups=2,
+        )
+
+        files = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(4)
+        ]
+        mock_lovlig.get_changed_files.return_value = files
+
+        orchestrator.run(pipeline_config)
+
+        prefetched = [c.args[0] for c in mock_file_processor.prefetch.call_args_list]
+        assert prefetched == [[files[1]], [files[2]], [files[3]]]
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_checkpoints_state_every_n_files(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test orchestrator snapshots state every checkpoint_every files and at the end."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            checkpoint_every=2,
+        )
+
+        mock_lovlig.get_changed_files.return_value = [
+            LovligFileInfo(
+                doc_id=f"doc{i}",
+                path=Path(f"/data/doc{i}.xml"),
+                hash=f"hash{i}",
+                dataset="test",
+            )
+            for i in range(5)
+        ]
+
+        with patch.object(ProcessingState, "save", autospec=True) as mock_save:
+            orchestrator.run(pipeline_config)
+
+        # After files 2 and 4, then the final save
+        assert mock_save.call_count == 3
+
+    @patch("lovdata_pipeline.orchestration.pipeline_orchestrator.Lovlig")
+    def test_orchestrator_deletes_removed_files_in_parallel_batches(
+        self, mock_lovlig_class, pipeline_config, mock_lovlig, mock_file_processor, mock_vector_store
+    ):
+        """Test orchestrator splits removals into batches across workers."""
+        mock_lovlig_class.return_value = mock_lovlig
+        orchestrator = PipelineOrchestrator(
+            file_processor=mock_file_processor,
+            vector_store=mock_vector_store,
+            max_workers=4,
+        )
+
+        mock_lovlig.get_removed_files.return_value = [
+            LovligRemovedFileInfo(doc_id=f"doc{i}", dataset="test") for i in range(250)
+        ]
+
+        result = orchestrator.run(pipeline_config)
+
+        assert result.removed == 250
+        batch_sizes = sorted(
+            len(call.args[0]) for call in mock_vector_store.delete_by_document_ids.call_args_list
+        )
+        assert batch_sizes == [50, 100, 100]
@@ -1,5 +1,7 @@
 """Tests for ChromaDB vector store."""
 
+from unittest.mock import patch
+
 import chromadb
 import pytest
 
@@ -108,6 +110,56 @@ def test_delete_by_document_id(chroma_store, sample_chunks):
     assert remaining_doc_ids == ["doc2"]
 
 
+
+def test_delete_by_document_ids(chroma_store, sample_chunks):
+    """Test deleting several documents reports per-document counts."""
+    chroma_store.upsert_chunks(sample_chunks)
+    chroma_store.upsert_chunks(
+        [
+            EnrichedChunk(
+                chunk_id="doc2_chunk_0",
+                document_id="doc2",
+                dataset_name="test-dataset",
+                content="Other content",
+                token_count=10,
+                source_hash="def456",
+                embedding=[0.7, 0.8, 0.9],
+                embedding_model="test-model",
+                embedded_at="2025-11-22T12:00:00Z",
+            )
+        ]
+    )
+
+    deleted = chroma_store.delete_by_document_ids(["doc1", "doc2", "missing"])
+
+    assert deleted == {"doc1": 3, "doc2": 1, "missing": 0}
+    assert chroma_store.count() == 0
+
+
+def test_delete_by_document_ids_spans_filter_batches(chroma_store):
+    """Test deleting more documents than fit in one $in filter."""
+    chroma_store.upsert_chunks(
+        [
+            EnrichedChunk(
+                chunk_id=f"doc{i}_chunk_0",
+                document_id=f"doc{i}",
+                dataset_name="test-dataset",
+                content=f"Content {i}",
+                token_count=10,
+                source_hash=f"hash{i}",
+                embedding=[0.1, 0.2, 0.3],
+                embedding_model="test-model",
+                embedded_at="2025-11-22T12:00:00Z",
+            )
+            for i in range(250)
+        ]
+    )
+
+    deleted = chroma_store.delete_by_document_ids([f"doc{i}" for i in range(250)])
+
+    assert sum(deleted.values()) == 250
+    assert chroma_store.count() == 0
+
 def test_get_all_document_ids(chroma_store):
     """Test getting all unique document IDs."""
     # Insert chunks from multiple documents
@@ -189,6 +241,24 @@ def test_count(chroma_store, sample_chunks):
     assert chroma_store.count() == 4
 
 
+def test_ping(chroma_store, sample_chunks):
+    """Test ping succeeds on empty and populated collections."""
+    chroma_store.ping()
+    chroma_store.upsert_chunks(sample_chunks)
+    chroma_store.ping()
+
+
+def test_upsert_splits_into_batches(chroma_collection, sample_chunks):
+    """Test large upserts are written in slices of at most upsert_batch_size."""
+    store = ChromaVectorStoreRepository(chroma_collection, upsert_batch_size=2)
+
+    with patch.object(chroma_collection, "upsert", wraps=chroma_collection.upsert) as upsert:
+        store.upsert_chunks(sample_chunks)
+
+    assert [len(c.kwargs["ids"]) for c in upsert.call_args_list] == [2, 1]
+    assert store.count() == 3
+
+
 def test_upsert_empty_list(chroma_store):
     """Test upserting empty list does nothing."""
     chroma_store.upsert_chunks([])
@@ -0,0 +1,48 @@
+"""Tests for the on-disk embedding cache."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from lovdata_pipeline.infrastructure.embedding_cache import CachedEmbeddingProvider
+
+
+@pytest.fixture
+def provider():
+    """Create a provider embedding each text as its length."""
+    provider = Mock()
+    provider.get_model_name.return_value = "test-model"
+    provider.embed_batch.side_effect = lambda texts: [[float(len(t)), 0.5] for t in texts]
+    return provider
+
+
+def test_cache_only_embeds_unseen_texts(tmp_path, provider):
+    """Test cached texts are served locally and only misses reach the provider."""
+    cache = CachedEmbeddingProvider(provider, tmp_path / "cache.sqlite")
+
+    assert cache.embed_batch(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    assert cache.embed_batch(["bb", "ccc", "a"]) == [[2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+
+    assert [c.args[0] for c in provider.embed_batch.call_args_list] == [["a", "bb"], ["ccc"]]
+
+
+def test_cache_persists_and_deduplicates(tmp_path, provider):
+    """Test vectors survive reopening and repeated texts are embedded once."""
+    cache_file = tmp_path / "cache.sqlite"
+    first = CachedEmbeddingProvider(provider, cache_file)
+    assert first.embed_batch(["x", "x"]) == [[1.0, 0.5], [1.0, 0.5]]
+    first.close()
+
+    second = CachedEmbeddingProvider(provider, cache_file)
+    assert second.embed_batch(["x"]) == [[1.0, 0.5]]
+
+    provider.embed_batch.assert_called_once_with(["x"])
+
+
+def test_cache_is_keyed_by_namespace(tmp_path, provider):
+    """Test a different model configuration does not reuse cached vectors."""
+    cache_file = tmp_path / "cache.sqlite"
+    CachedEmbeddingProvider(provider, cache_file, namespace="m:1024").embed_batch(["x"])
+    CachedEmbeddingProvider(provider, cache_file, namespace="m:512").embed_batch(["x"])
+
+    assert provider.embed_batch.call_count == 2
@@ -0,0 +1,99 @@
+"""Unit tests for EmbeddingService."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from lovdata_pipeline.domain.models import ChunkMetadata
+from lovdata_pipeline.domain.services.embedding_service import EmbeddingService
+
+
+def _chunks(count):
+    """Create chunks whose text encodes their position."""
+    return [
+        ChunkMetadata(
+            chunk_id=f"c{i}",
+            document_id="doc",
+            dataset_name="test",
+            content=str(i),
+            token_count=1,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def provider():
+    """Create a provider embedding each text as its integer value."""
+    provider = Mock()
+    provider.get_model_name.return_value = "test-model"
+    provider.embed_batch.side_effect = lambda texts: [[float(t)] for t in texts]
+    return provider
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_embed_chunks_preserves_order(provider, concurrency):
+    """Test embeddings and progress follow input order at any concurrency."""
+    service = EmbeddingService(provider, batch_size=3, max_concurrent_requests=concurrency)
+    progress = []
+
+    enriched = service.embed_chunks(_chunks(10), progress_callback=lambda c, t: progress.append(c))
+
+    assert [e.embedding[0] for e in enriched] == [float(i) for i in range(10)]
+    assert progress == [3, 6, 9, 10]
+    assert provider.embed_batch.call_count == 4
+    # All batches of one call share a single timestamp
+    assert len({e.embedded_at for e in enriched}) == 1
+
+
+def test_embed_chunks_overlaps_requests(provider):
+    """Test several batches are in flight at once, bounded by the limit."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def embed(texts):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return [[0.0] for _ in texts]
+
+    provider.embed_batch.side_effect = embed
+    service = EmbeddingService(provider, batch_size=1, max_concurrent_requests=3)
+
+    service.embed_chunks(_chunks(9))
+
+    assert peak == 3
+
+
+def test_embed_chunks_propagates_batch_failure(provider):
+    """Test a failing batch fails the whole call."""
+    provider.embed_batch.side_effect = RuntimeError("rate limited")
+    service = EmbeddingService(provider, batch_size=2, max_concurrent_requests=2)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        service.embed_chunks(_chunks(6))
+
+
+def test_embed_chunks_packs_batches_by_token_budget(provider):
+    """Test batches close at the token budget and oversized chunks go alone."""
+    chunks = _chunks(7)
+    for chunk, tokens in zip(chunks, [3, 3, 3, 12, 1, 1, 1], strict=True):
+        chunk.token_count = tokens
+    service = EmbeddingService(provider, batch_size=3, max_batch_tokens=7)
+
+    enriched = service.embed_chunks(chunks)
+
+    assert [c.args[0] for c in provider.embed_batch.call_args_list] == [
+        ["0", "1"],
+        ["2"],
+        ["3"],
+        ["4", "5", "6"],
+    ]
+    assert [e.embedding[0] for e in enriched] == [float(i) for i in range(7)]
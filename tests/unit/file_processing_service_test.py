@@ -0,0 +1,204 @@
+"""Unit tests for FileProcessingService.
+
+Covers pooling embeddings and upserts across files, prefetching and
+process-pool chunking; the single-file path is exercised by the end-to-end
+tests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lovdata_pipeline.domain.models import ChunkMetadata, FileInfo
+from lovdata_pipeline.domain.services.chunking_service import ChunkingService
+from lovdata_pipeline.domain.services.embedding_service import EmbeddingService
+from lovdata_pipeline.domain.services.file_processing_service import FileProcessingService
+from lovdata_pipeline.infrastructure.jsonl_vector_store import JsonlVectorStoreRepository
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Create three source files on disk."""
+    infos = []
+    for i in range(3):
+        path = tmp_path / f"doc{i}.xml"
+        path.write_text("<html/>")
+        infos.append(FileInfo(doc_id=f"doc{i}", path=path, dataset="test", hash=f"hash{i}"))
+    return infos
+
+
+def _chunks_for(path, doc_id, dataset, source_hash):
+    """Return two chunks per document."""
+    return [
+        ChunkMetadata(
+            chunk_id=f"{doc_id}_{n}",
+            document_id=doc_id,
+            dataset_name=dataset,
+            content=f"{doc_id} text {n}",
+            token_count=3,
+            source_hash=source_hash,
+        )
+        for n in range(2)
+    ]
+
+
+@pytest.fixture
+def provider():
+    """Create an embedding provider returning one vector per text."""
+    provider = Mock()
+    provider.get_model_name.return_value = "test-model"
+    provider.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    return provider
+
+
+@pytest.fixture
+def service(tmp_path, provider):
+    """Create a file processing service over a JSONL store."""
+    chunking = Mock(spec=ChunkingService)
+    chunking.chunk_file.side_effect = _chunks_for
+    return FileProcessingService(
+        chunking_service=chunking,
+        embedding_service=EmbeddingService(provider=provider, batch_size=100),
+        vector_store=JsonlVectorStoreRepository(tmp_path / "store"),
+    )
+
+
+def test_process_files_pools_embedding_requests(service, provider, files):
+    """Test chunks from several files are embedded in one request and indexed per file."""
+    results = service.process_files(files)
+
+    assert [r.success for r in results] == [True, True, True]
+    assert [r.chunk_count for r in results] == [2, 2, 2]
+    assert provider.embed_batch.call_count == 1
+
+    store = service._vector_store
+    for info in files:
+        chunks = store.get_chunks_by_document_id(info.doc_id)
+        assert sorted(c.chunk_id for c in chunks) == [
+            f"{info.doc_id}_chunk_0",
+            f"{info.doc_id}_chunk_1",
+        ]
+
+
+def test_process_files_isolates_failures(service, provider, files):
+    """Test a failing embedding request is retried per file so only its file fails."""
+
+    def embed(texts):
+        if any(t.startswith("doc1") for t in texts):
+            raise RuntimeError("rejected")
+        return [[1.0] for _ in texts]
+
+    provider.embed_batch.side_effect = embed
+    files[2] = FileInfo(
+        doc_id="missing", path=files[2].path.with_name("nope.xml"), dataset="test", hash="h"
+    )
+
+    results = service.process_files(files)
+
+    assert [r.success for r in results] == [True, False, False]
+    assert results[1].error_message == "rejected"
+    assert "File not found" in results[2].error_message
+    # The per-file retry reuses the chunks instead of parsing the files again
+    assert service._chunking_service.chunk_file.call_count == 2
+
+
+def test_process_files_upserts_group_once(service, files):
+    """Test a group's vectors are written in one upsert call."""
+    store = service._vector_store
+    with patch.object(store, "upsert_chunks", wraps=store.upsert_chunks) as upsert:
+        results = service.process_files(files)
+
+    assert [r.chunk_count for r in results] == [2, 2, 2]
+    assert upsert.call_count == 1
+    assert len(upsert.call_args.args[0]) == 6
+
+
+def test_failed_group_upsert_is_retried_per_file(service, files):
+    """Test a failing shared upsert only fails the file whose chunks the store rejects."""
+    store = service._vector_store
+    real_upsert = store.upsert_chunks
+
+    def upsert(chunks):
+        if any(c.document_id == "doc1" for c in chunks):
+            raise OSError("disk full")
+        real_upsert(chunks)
+
+    with patch.object(store, "upsert_chunks", side_effect=upsert):
+        results = service.process_files(files)
+
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error_message == "disk full"
+    assert store.get_chunks_by_document_id("doc1") == []
+    assert len(store.get_chunks_by_document_id("doc2")) == 2
+
+
+def test_process_file_uses_prefetched_chunks(service, files):
+    """Test a prefetched file is chunked once, in the background."""
+    service.prefetch(files[:2])
+
+    results = [service.process_file(info) for info in files[:2]]
+
+    assert [r.chunk_count for r in results] == [2, 2]
+    assert service._chunking_service.chunk_file.call_count == 2
+    assert not service._prefetched
+
+
+def test_prefetched_chunking_error_fails_only_that_file(service, files):
+    """Test a chunking error raised in the background surfaces on processing."""
+    service._chunking_service.chunk_file.side_effect = RuntimeError("bad xml")
+    service.prefetch(files[:1])
+
+    result = service.process_file(files[0])
+
+    assert not result.success
+    assert result.error_message == "bad xml"
+
+
+def test_chunk_processes_chunk_in_worker_processes(tmp_path, provider):
+    """Test chunking in a process pool yields the same chunks as in-process chunking."""
+    path = tmp_path / "law.xml"
+    path.write_text(
+        '<html><body><main><h1>Testlov</h1><article class="legalArticle">'
+        '<span class="legalArticleValue">§ 1</span>'
+        '<article class="legalP">Loven gjelder for alle.</article>'
+        "</article></main></body></html>",
+        encoding="utf-8",
+    )
+    info = FileInfo(doc_id="law", path=path, dataset="test", hash="h")
+    missing = FileInfo(doc_id="gone", path=tmp_path / "gone.xml", dataset="test", hash="h")
+
+    service = FileProcessingService(
+        chunking_service=ChunkingService(),
+        embedding_service=EmbeddingService(provider=provider, batch_size=100),
+        vector_store=JsonlVectorStoreRepository(tmp_path / "store"),
+        chunk_processes=1,
+    )
+    try:
+        service.prefetch([info])
+        pooled = service._take_chunks(info, None)
+        direct = service._take_chunks(missing, None)
+    finally:
+        service.close()
+
+    assert pooled == ChunkingService().chunk_file(path, "law", "test", "h")
+    assert not direct.success
+    assert "File not found" in direct.error_message
+
+
+def test_process_pool_is_started_once_across_threads(tmp_path, provider):
+    """Test concurrent callers share one chunking pool."""
+    service = FileProcessingService(
+        chunking_service=ChunkingService(),
+        embedding_service=EmbeddingService(provider=provider),
+        vector_store=JsonlVectorStoreRepository(tmp_path / "store"),
+        chunk_processes=1,
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pools = list(executor.map(lambda _: service._process_pool(), range(32)))
+    finally:
+        service.close()
+
+    assert len({id(pool) for pool in pools}) == 1
+    assert service._chunk_pool is None
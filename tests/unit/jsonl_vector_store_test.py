@@ -1,7 +1,10 @@
 """Tests for JSONL vector store."""
 
 import tempfile
+import threading
+from array import array
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -130,6 +133,33 @@ def test_delete_by_document_id(temp_storage_dir, sample_chunks):
     assert remaining[0].document_id == "doc2"
 
 
+
+def test_delete_by_document_ids(temp_storage_dir, sample_chunks):
+    """Test deleting several documents sharing a file reports per-document counts."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    store.upsert_chunks(sample_chunks)
+    store.upsert_chunks(
+        [
+            EnrichedChunk(
+                chunk_id="doc2_chunk_0",
+                document_id="doc2",
+                dataset_name="test-dataset",
+                content="Other content",
+                token_count=10,
+                source_hash="abc123",
+                embedding=[0.7, 0.8, 0.9],
+                embedding_model="test-model",
+                embedded_at="2025-11-20T12:00:00Z",
+            )
+        ]
+    )
+
+    deleted = store.delete_by_document_ids(["doc1", "doc2", "missing"])
+
+    assert deleted == {"doc1": 3, "doc2": 1, "missing": 0}
+    assert not (temp_storage_dir / "abc123.jsonl").exists()
+    assert store.get_all_document_ids() == set()
+
 def test_delete_removes_empty_file(temp_storage_dir, sample_chunks):
     """Test that deleting all chunks removes the file."""
     store = JsonlVectorStoreRepository(temp_storage_dir)
@@ -158,6 +188,16 @@ def test_count(temp_storage_dir, sample_chunks):
     assert store.count() == 3
 
 
+def test_ping(temp_storage_dir):
+    """Test ping succeeds while the storage directory exists."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    store.ping()
+
+    temp_storage_dir.rmdir()
+    with pytest.raises(FileNotFoundError):
+        store.ping()
+
+
 def test_get_chunks_by_hash(temp_storage_dir, sample_chunks):
     """Test retrieving chunks by hash."""
     store = JsonlVectorStoreRepository(temp_storage_dir)
@@ -281,3 +321,149 @@ def test_multiple_documents_same_hash(temp_storage_dir):
     # Should have only one file
     hashes = store.list_hashes()
     assert len(hashes) == 1
+
+
+def test_document_index_tracks_upserts_and_deletes(temp_storage_dir, sample_chunks):
+    """Test that the document index stays in sync across store instances and mutations."""
+    JsonlVectorStoreRepository(temp_storage_dir).upsert_chunks(sample_chunks)
+
+    # Fresh instance builds its index from the files on disk
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    assert store.get_all_document_ids() == {"doc1"}
+
+    other = sample_chunks[0].model_copy(
+        update={"chunk_id": "doc2_chunk_0", "document_id": "doc2", "source_hash": "def456"}
+    )
+    store.upsert_chunks([other])
+    assert store.get_all_document_ids() == {"doc1", "doc2"}
+
+    assert store.delete_by_document_id("doc1") == 3
+    assert store.get_all_document_ids() == {"doc2"}
+    assert len(store.get_chunks_by_document_id("doc2")) == 1
+
+
+def test_upsert_during_index_build_is_indexed(temp_storage_dir, sample_chunks):
+    """Test a file written while the index is being built still ends up indexed."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    store.upsert_chunks(sample_chunks)
+    existing = list(store._data_files())
+    other = sample_chunks[0].model_copy(
+        update={"chunk_id": "doc2_chunk_0", "document_id": "doc2", "source_hash": "def456"}
+    )
+
+    release = threading.Event()
+    read_file = store._iter_chunks_from_file
+
+    def slow_read(path):
+        if path in existing:
+            release.wait()
+        return read_file(path)
+
+    # The build scans only the files present when it started and stalls mid-scan
+    with (
+        patch.object(store, "_data_files", return_value=existing),
+        patch.object(store, "_iter_chunks_from_file", side_effect=slow_read),
+    ):
+        builder = threading.Thread(target=store.get_all_document_ids)
+        builder.start()
+        writer = threading.Thread(target=store.upsert_chunks, args=([other],))
+        writer.start()
+        writer.join(timeout=0.2)
+        release.set()
+        builder.join()
+        writer.join()
+
+    assert store.get_all_document_ids() == {"doc1", "doc2"}
+    assert store.delete_by_document_id("doc2") == 1
+
+
+def test_failed_delete_keeps_index_entries(temp_storage_dir, sample_chunks):
+    """Test a delete whose rewrite fails can be retried."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    other = sample_chunks[0].model_copy(update={"chunk_id": "doc2_chunk_0", "document_id": "doc2"})
+    store.upsert_chunks([*sample_chunks, other])
+
+    with (
+        patch.object(store, "_write_chunks_to_file", side_effect=OSError("disk full")),
+        pytest.raises(OSError),
+    ):
+        store.delete_by_document_id("doc1")
+
+    assert store.delete_by_document_id("doc1") == 3
+    assert store.get_all_document_ids() == {"doc2"}
+
+
+def test_iter_chunks_batches(temp_storage_dir, sample_chunks):
+    """Test that iter_chunks streams all chunks in bounded batches."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    store.upsert_chunks(sample_chunks)
+
+    batches = list(store.iter_chunks(batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert {c.chunk_id for b in batches for c in b} == {c.chunk_id for c in sample_chunks}
+
+
+def test_load_skips_malformed_lines_and_empty_files(temp_storage_dir, sample_chunks):
+    """Test that reading tolerates empty files and corrupt lines."""
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+    store.upsert_chunks(sample_chunks)
+
+    with open(temp_storage_dir / "abc123.jsonl", "a") as f:
+        f.write("not json\n")
+    (temp_storage_dir / "empty.jsonl").touch()
+
+    assert len(store.get_chunks_by_hash("abc123")) == 3
+    assert store.get_chunks_by_hash("empty") == []
+
+
+def test_compressed_storage_round_trip(temp_storage_dir, sample_chunks):
+    """Test gzip-compressed files are written and readable alongside plain ones."""
+    JsonlVectorStoreRepository(temp_storage_dir).upsert_chunks(sample_chunks)
+
+    store = JsonlVectorStoreRepository(temp_storage_dir, compress=True)
+    store.upsert_chunks(sample_chunks[:1])
+
+    # Existing plain file is converted to the compressed format on write
+    assert (temp_storage_dir / "abc123.jsonl.gz").exists()
+    assert not (temp_storage_dir / "abc123.jsonl").exists()
+    assert store.list_hashes() == ["abc123"]
+    assert store.count() == 3
+    assert len(store.get_chunks_by_document_id("doc1")) == 3
+
+    # A plain store can still read compressed files
+    assert len(JsonlVectorStoreRepository(temp_storage_dir).get_chunks_by_hash("abc123")) == 3
+
+
+def test_upsert_spanning_many_hashes_writes_all_files(temp_storage_dir, sample_chunks):
+    """Test that a batch spanning several source files is written in parallel correctly."""
+    store = JsonlVectorStoreRepository(temp_storage_dir, max_concurrent_upserts=4)
+    chunks = [
+        sample_chunks[0].model_copy(
+            update={"chunk_id": f"doc{i}_chunk_0", "document_id": f"doc{i}", "source_hash": f"h{i}"}
+        )
+        for i in range(10)
+    ]
+
+    store.upsert_chunks(chunks)
+
+    assert sorted(store.list_hashes()) == sorted(f"h{i}" for i in range(10))
+    assert store.get_all_document_ids() == {f"doc{i}" for i in range(10)}
+
+
+def test_upsert_writes_embeddings_at_float32_precision(temp_storage_dir, sample_chunks):
+    """Test float32 embeddings are stored with short decimals and read back exactly."""
+    vector = array("f", [0.1, -0.0123456789, 3e-8]).tolist()
+    sample_chunks[0].embedding = vector
+    store = JsonlVectorStoreRepository(temp_storage_dir)
+
+    store.upsert_chunks(sample_chunks[:1])
+
+    # The caller's chunk is not modified
+    assert sample_chunks[0].embedding == vector
+    assert sample_chunks[0].embedding[0] == 0.10000000149011612
+    text = (temp_storage_dir / "abc123.jsonl").read_text()
+    assert "0.10000000149011612" not in text
+    assert "0.100000001" in text
+    (stored,) = store.get_chunks_by_document_id("doc1")
+    assert array("f", stored.embedding).tolist() == vector
@@ -1,11 +1,14 @@
 """Unit tests for LovdataChunker."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 import pytest
+from lxml import etree
 
-from lovdata_pipeline.domain.parsers.lovdata_chunker import Chunk, LovdataChunker
+from lovdata_pipeline.domain.parsers.lovdata_chunker import Chunk, LovdataChunker, _get_parser
 
 
 @pytest.fixture
@@ -647,3 +650,87 @@ class TestChunkDataclass:
         assert chunk.metadata["paragraph_ref"] == "§ 1"
         assert chunk.metadata["ledd_number"] == 1
         assert chunk.metadata["document_title"] == "Test Law"
+
+
+def test_section_heading_prefers_shallowest_heading_level(chunker):
+    """Test an h2 anywhere in the section wins over an earlier h3 or h4."""
+    section = etree.fromstring(
+        "<section><h4>Fire</h4><div><h3>Tre</h3></div><div><h2>To</h2></div></section>"
+    )
+    assert chunker._get_section_heading(section) == "To"
+
+    section = etree.fromstring("<section><h4>Fire</h4><div><h3>Tre</h3></div></section>")
+    assert chunker._get_section_heading(section) == "Tre"
+
+    assert chunker._get_section_heading(etree.fromstring("<section><p/></section>")) == ""
+
+
+def test_paragraph_header_reads_reference_and_title(chunker):
+    """Test the § reference and title come from the first matching spans."""
+    article = etree.fromstring(
+        '<article><h2><span class="legalArticleValue">§ 5</span>'
+        '<span class="legalArticleTitle">Formål</span></h2>'
+        '<article><span class="legalArticleValue">§ 9</span></article></article>'
+    )
+    assert chunker._get_paragraph_header(article) == ("§ 5", "Formål")
+
+    untitled = etree.fromstring('<article><span class="legalArticleValue">§ 6</span></article>')
+    assert chunker._get_paragraph_header(untitled) == ("§ 6", None)
+
+
+def test_split_sentences_drops_empty_fragments():
+    """Test sentences split after terminal punctuation and are stripped."""
+    text = "  Første ledd gjelder.  Andre ledd?\n\nTredje!   "
+    assert LovdataChunker._split_sentences(text) == ["Første ledd gjelder.", "Andre ledd?", "Tredje!"]
+    assert LovdataChunker._split_sentences("   ") == []
+
+
+def test_parser_is_reused_per_thread():
+    """Test each thread reuses one parser and threads never share it."""
+    assert _get_parser() is _get_parser()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_get_parser).result() is not _get_parser()
+
+
+def test_hierarchical_context_extracts_each_section_heading_once(chunker):
+    """Test articles in one section share its heading, extracted on first use."""
+    root = etree.fromstring(
+        '<main><section class="section"><h2>Kapittel 1</h2>'
+        '<article id="a"/><article id="b"/></section></main>'
+    )
+    first, second = root.iter("article")
+    headings: dict = {}
+
+    with patch.object(chunker, "_get_section_heading", wraps=chunker._get_section_heading) as get:
+        a = chunker._get_hierarchical_context(first, "Lov", headings)
+        b = chunker._get_hierarchical_context(second, "Lov", headings)
+
+    assert get.call_count == 1
+    assert a == b == {
+        "document_title": "Lov",
+        "chapter_path": ["Kapittel 1"],
+        "section_heading": "Kapittel 1",
+    }
+    assert a["section_heading"] is b["section_heading"]
+
+
+def test_hierarchical_context_orders_chapter_path_outermost_first(chunker):
+    """Test nested sections give an outermost-first path and the innermost heading."""
+    root = etree.fromstring(
+        '<main><section class="section"><h2>Del I</h2>'
+        '<section class="section"><h3>Kapittel 2</h3><article id="a"/></section>'
+        "</section></main>"
+    )
+    context = chunker._get_hierarchical_context(next(root.iter("article")), "Lov")
+
+    assert context["chapter_path"] == ["Del I", "Kapittel 2"]
+    assert context["section_heading"] == "Kapittel 2"
+
+
+def test_ledd_text_skips_comments_and_keeps_tails(chunker):
+    """Test comment children add no text while their tails and entities are kept."""
+    ledd = etree.fromstring(
+        '<article class="legalP">Første <!-- redaksjonell merknad -->del '
+        "<a href='#x'>A &amp; B</a> slutt.</article>"
+    )
+    assert chunker._extract_ledd_text(ledd) == "Første del A & B slutt."
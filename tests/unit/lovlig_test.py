@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from lovdata_pipeline.lovlig import Lovlig
+from lovdata_pipeline.lovlig import Lovlig, _stem
 
 
 @pytest.fixture
@@ -114,6 +114,22 @@ def test_empty_state_file(tmp_path):
     assert not removed
 
 
+def test_dataset_without_files_is_skipped(temp_lovlig_setup):
+    """Test a dataset entry lacking "files" does not break the scan."""
+    state_file = temp_lovlig_setup["state_file"]
+    state = json.loads(state_file.read_text())
+    state["raw_datasets"]["gjeldende-forskrifter.tar.bz2"] = {}
+    state_file.write_text(json.dumps(state))
+    lovlig = Lovlig(
+        dataset_filter="gjeldende",
+        raw_dir=temp_lovlig_setup["raw_dir"],
+        extracted_dir=temp_lovlig_setup["extracted_dir"],
+        state_file=state_file,
+    )
+
+    assert [f.doc_id for f in lovlig.get_changed_files()] == ["nl-001", "nl-002"]
+
+
 @patch("lovdata_pipeline.lovlig.sync_datasets")
 def test_sync(mock_sync, tmp_path):
     """Test sync wrapper."""
@@ -154,3 +170,77 @@ def test_sync(mock_sync, tmp_path):
     assert stats.added == 1
     assert stats.modified == 1
     assert stats.removed == 1
+
+
+def test_state_parsed_once_until_file_changes(temp_lovlig_setup):
+    """Test that state.json is re-parsed only when the file changes."""
+    lovlig = Lovlig(
+        dataset_filter="gjeldende",
+        raw_dir=temp_lovlig_setup["raw_dir"],
+        extracted_dir=temp_lovlig_setup["extracted_dir"],
+        state_file=temp_lovlig_setup["state_file"],
+    )
+
+    with patch("lovdata_pipeline.lovlig.json.loads", wraps=json.loads) as mock_load:
+        lovlig.get_changed_files()
+        lovlig.get_removed_files()
+        assert mock_load.call_count == 1
+
+        temp_lovlig_setup["state_file"].write_text(json.dumps({"raw_datasets": {}}))
+        assert lovlig.get_changed_files() == []
+        assert mock_load.call_count == 2
+
+
+def test_scan_state_partitions_in_one_pass(temp_lovlig_setup):
+    """Test scan_state returns stats, changed and removed files together."""
+    lovlig = Lovlig(
+        dataset_filter="gjeldende",
+        raw_dir=temp_lovlig_setup["raw_dir"],
+        extracted_dir=temp_lovlig_setup["extracted_dir"],
+        state_file=temp_lovlig_setup["state_file"],
+    )
+
+    stats, changed, removed = lovlig.scan_state()
+
+    assert (stats.added, stats.modified, stats.removed) == (1, 1, 1)
+    assert [f.doc_id for f in changed] == ["nl-001", "nl-002"]
+    assert [f.doc_id for f in removed] == ["nl-003"]
+    assert changed[0].path == temp_lovlig_setup["extracted_dir"] / "gjeldende-lover/nl/nl-001.xml"
+
+
+def test_scan_snapshot_reused_until_state_changes(temp_lovlig_setup):
+    """Test scan() returns the memoized snapshot while state.json is unchanged."""
+    lovlig = Lovlig(
+        dataset_filter="gjeldende",
+        raw_dir=temp_lovlig_setup["raw_dir"],
+        extracted_dir=temp_lovlig_setup["extracted_dir"],
+        state_file=temp_lovlig_setup["state_file"],
+    )
+
+    snapshot = lovlig.scan()
+    assert lovlig.scan() is snapshot
+    assert len(snapshot.all_files) == 2
+
+    temp_lovlig_setup["state_file"].write_text(json.dumps({"raw_datasets": {}}))
+    assert lovlig.scan().all_files == []
+
+
+def test_iter_all_files_matches_get_all_files(temp_lovlig_setup):
+    """Test the all-files iterator yields the same records as the list getter."""
+    lovlig = Lovlig(
+        dataset_filter="gjeldende",
+        raw_dir=temp_lovlig_setup["raw_dir"],
+        extracted_dir=temp_lovlig_setup["extracted_dir"],
+        state_file=temp_lovlig_setup["state_file"],
+    )
+
+    assert list(lovlig.iter_all_files()) == lovlig.get_all_files()
+
+
+@pytest.mark.parametrize(
+    "rel_path",
+    ["nl/nl-18840614-003.xml", "doc.xml", "doc", "a/b.tar.bz2", "a/.hidden", "a/trailing."],
+)
+def test_stem_matches_pathlib(rel_path):
+    """Test the fast stem helper agrees with Path.stem."""
+    assert _stem(rel_path) == Path(rel_path).stem
@@ -9,7 +9,10 @@ from tempfile import NamedTemporaryFile
 import pytest
 from lxml import etree
 
-from lovdata_pipeline.domain.services.metadata_enrichment_service import MetadataEnrichmentService
+from lovdata_pipeline.domain.services.metadata_enrichment_service import (
+    MetadataEnrichmentService,
+    extract_document_info,
+)
 
 
 @pytest.fixture
@@ -222,3 +225,21 @@ class TestIntegration:
         enriched = service.enrich(base_chunk_data, root)
 
         assert enriched["chunk_id"] == base_chunk_data["chunk_id"]
+
+
+def test_document_info_reads_first_header_entries():
+    """Test document info comes from the first matching header entries."""
+    root = etree.fromstring(
+        "<html><dl>"
+        '<dd class="title">Lov om arbeidsmiljø</dd><dd class="title">Ignorert</dd>'
+        '<dd class="dokid">NL/lov/2005-06-17-62</dd>'
+        '<dd class="ministry">Ingen liste</dd>'
+        '<dd class="ministry"><ul><li>Arbeidsdepartementet</li></ul></dd>'
+        "</dl></html>"
+    )
+
+    assert extract_document_info({}, root) == {
+        "document_title": "Lov om arbeidsmiljø",
+        "document_date": "2005-06-17",
+        "department": "Arbeidsdepartementet",
+    }
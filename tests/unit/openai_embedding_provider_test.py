@@ -0,0 +1,47 @@
+"""Tests for OpenAI embedding provider."""
+
+from unittest.mock import Mock
+
+import pytest
+from openai import BadRequestError
+
+from lovdata_pipeline.infrastructure.openai_embedding_provider import OpenAIEmbeddingProvider
+
+
+def _bad_request() -> BadRequestError:
+    return BadRequestError("Input too long", response=Mock(status_code=400, headers={}), body=None)
+
+
+def _client_rejecting(bad_text: str) -> Mock:
+    """Create a mock client whose API rejects any batch containing bad_text."""
+
+    def create(input, model, **kwargs):  # noqa: A002
+        if bad_text in input:
+            raise _bad_request()
+        return Mock(data=[Mock(embedding=[float(len(t))]) for t in input])
+
+    client = Mock()
+    client.embeddings.create.side_effect = create
+    return client
+
+
+def test_embed_batch_passes_dimensions():
+    """Test that dimensions are forwarded to the API."""
+    client = _client_rejecting("never")
+    provider = OpenAIEmbeddingProvider(client, "test-model", dimensions=256)
+
+    assert provider.embed_batch(["a", "bb"]) == [[1.0], [2.0]]
+    client.embeddings.create.assert_called_once_with(
+        input=["a", "bb"], model="test-model", dimensions=256
+    )
+
+
+def test_rejected_batch_is_not_retried():
+    """Test a rejected batch fails after a single request."""
+    client = _client_rejecting("bad")
+    provider = OpenAIEmbeddingProvider(client, "test-model")
+
+    with pytest.raises(BadRequestError):
+        provider.embed_batch(["a", "bb", "bad", "cccc"])
+
+    client.embeddings.create.assert_called_once()
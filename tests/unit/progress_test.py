@@ -0,0 +1,40 @@
+"""Unit tests for progress trackers."""
+
+from io import StringIO
+
+from rich.console import Console
+
+from lovdata_pipeline.progress import RichProgressTracker
+
+
+def test_embedding_display_reused_across_files():
+    """Test the embedding display is started once per stage, not once per file."""
+    tracker = RichProgressTracker(console=Console(file=StringIO()))
+    tracker.start_file_processing(2)
+
+    tracker.start_embedding(0)
+    progress = tracker._embedding_progress
+    tracker.update_embedding(5, 5)
+    tracker.end_embedding()
+
+    tracker.start_embedding(0)
+    assert tracker._embedding_progress is progress
+    assert len(progress.tasks) == 1
+    tracker.end_embedding()
+
+    tracker.end_file_processing()
+    assert tracker._embedding_progress is None
+
+
+def test_final_file_update_not_throttled():
+    """Test the completing update always lands even right after another update."""
+    tracker = RichProgressTracker(console=Console(file=StringIO()))
+    tracker.start_file_processing(3)
+
+    tracker.update_file("doc1", 1, 3)
+    tracker.update_file("doc2", 2, 3)
+    tracker.update_file("", 3, 3)
+
+    task = tracker._file_progress.tasks[0]
+    assert task.completed == 3
+    tracker.end_file_processing()
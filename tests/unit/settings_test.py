@@ -66,6 +66,7 @@ def test_settings_defaults(monkeypatch):
     assert settings.chunk_max_tokens == 6800
     assert settings.dataset_filter == "gjeldende"
     assert settings.force is False
+    assert settings.max_workers == 1
 
 
 @pytest.mark.parametrize(
@@ -1,5 +1,8 @@
 """Tests for simplified state tracking."""
 
+import json
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -72,6 +75,18 @@ def test_mark_processed_removes_failed(tmp_path):
     assert "doc-1" in state.state.processed
 
 
+def test_mark_failed_removes_processed(tmp_path):
+    """Test that a failed reprocess drops the stale processed entry."""
+    state = ProcessingState(tmp_path / "state.json")
+
+    state.mark_processed("doc-1", "hash-v1")
+    state.mark_failed("doc-1", "hash-v2", "Error")
+
+    assert "doc-1" not in state.state.processed
+    assert "doc-1" in state.state.failed
+    assert state.stats() == {"processed": 0, "failed": 1}
+
+
 def test_remove_document(tmp_path):
     """Test removing a document from state."""
     state = ProcessingState(tmp_path / "state.json")
@@ -110,3 +125,206 @@ def test_corrupted_state_file(tmp_path):
     state = ProcessingState(state_file)
     assert state.state.processed == {}
     assert state.state.failed == {}
+
+
+def test_journal_replayed_without_save(tmp_path):
+    """Test that transitions survive a restart even if save() was never called."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+
+    state.mark_processed("doc-1", "hash-1")
+    state.mark_failed("doc-2", "hash-2", "Error")
+    state.mark_processed("doc-3", "hash-3")
+    state.remove("doc-3")
+    state.close()
+
+    assert not state_file.exists()
+
+    state2 = ProcessingState(state_file)
+    assert state2.is_processed("doc-1", "hash-1")
+    assert state2.state.failed["doc-2"].error == "Error"
+    assert "doc-3" not in state2.state.processed
+
+
+def test_save_truncates_journal(tmp_path):
+    """Test that save() folds the journal into the snapshot."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+
+    state.mark_processed("doc-1", "hash-1")
+    assert state.journal_file.exists()
+
+    state.save()
+    assert not state.journal_file.exists()
+    assert ProcessingState(state_file).is_processed("doc-1", "hash-1")
+
+
+def test_torn_journal_line_ignored(tmp_path):
+    """Test that a partially written trailing journal entry is skipped."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+    state.mark_processed("doc-1", "hash-1")
+    state.close()
+
+    with open(state.journal_file, "a") as f:
+        f.write('{"op": "processed", "doc_id": "doc-2"')
+
+    state2 = ProcessingState(state_file)
+    assert state2.is_processed("doc-1", "hash-1")
+    assert "doc-2" not in state2.state.processed
+
+    # The torn tail is compacted away, so later appends are not hidden behind it
+    assert not state2.journal_file.exists()
+    state2.mark_processed("doc-3", "hash-3")
+    state2.close()
+    assert ProcessingState(state_file).is_processed("doc-3", "hash-3")
+
+
+def test_long_journal_compacted_on_load(tmp_path):
+    """Test that a journal past the compaction threshold is folded in on load."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+    for i in range(3):
+        state.mark_processed(f"doc-{i}", f"hash-{i}")
+    state.close()
+
+    assert ProcessingState(state_file, compact_after=5).journal_file.exists()
+
+    state2 = ProcessingState(state_file, compact_after=3)
+    assert not state2.journal_file.exists()
+    assert state2.stats()["processed"] == 3
+
+
+def test_timestamps_serialized_as_iso(tmp_path):
+    """Test that in-memory nanosecond timestamps are written and read back as ISO strings."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+    state.mark_processed("doc-1", "hash-1")
+    state.save()
+
+    at_iso = json.loads(state_file.read_text())["processed"]["doc-1"]["at"]
+    assert at_iso.endswith("+00:00")
+
+    state2 = ProcessingState(state_file)
+    assert state2.state.processed["doc-1"].at_iso == at_iso
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    """Test that two trackers on the same file keep each other's transitions."""
+    state_file = tmp_path / "state.json"
+    writer_a = ProcessingState(state_file)
+    writer_b = ProcessingState(state_file)
+
+    writer_a.mark_processed("doc-a", "hash-a")
+    writer_b.mark_processed("doc-b", "hash-b")
+    writer_b.save()  # Folds doc-a from the shared journal into the snapshot
+    writer_a.mark_processed("doc-c", "hash-c")  # Goes to a fresh journal
+
+    with writer_a.update() as state:
+        state.mark_failed("doc-d", "hash-d", "Error")
+
+    reloaded = ProcessingState(state_file)
+    for doc_id in ("doc-a", "doc-b", "doc-c"):
+        assert doc_id in reloaded.state.processed
+    assert "doc-d" in reloaded.state.failed
+
+
+def test_save_keeps_records_from_a_newer_snapshot(tmp_path):
+    """Test save() reloads a snapshot another writer replaced instead of overwriting it."""
+    state_file = tmp_path / "state.json"
+    writer_a = ProcessingState(state_file)
+    writer_b = ProcessingState(state_file)
+
+    writer_a.mark_processed("doc-a", "hash-a")
+    writer_b.mark_processed("doc-b", "hash-b")
+    writer_b.save()  # Folds both journal entries into a new snapshot
+    writer_a.mark_processed("doc-c", "hash-c")  # Goes to a fresh journal
+    writer_a.save()
+
+    reloaded = ProcessingState(state_file)
+    for doc_id in ("doc-a", "doc-b", "doc-c"):
+        assert doc_id in reloaded.state.processed
+    assert "doc-b" in writer_a.state.processed
+
+
+def test_lock_excludes_threads_sharing_a_tracker(tmp_path):
+    """Test the state lock serializes threads, not just processes."""
+    state = ProcessingState(tmp_path / "state.json")
+    inside = 0
+    overlaps = 0
+
+    def hold():
+        nonlocal inside, overlaps
+        for _ in range(20):
+            with state._locked(), state._locked():
+                inside += 1
+                overlaps += inside > 1
+                time.sleep(0.0005)
+                inside -= 1
+
+    threads = [threading.Thread(target=hold) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == 0
+    assert state._lock_depth == 0
+
+
+def test_save_skips_unchanged_snapshot(tmp_path):
+    """Test that save() does not rewrite the snapshot when nothing changed."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+    state.mark_processed("doc-1", "hash-1")
+    state.save()
+    inode = state_file.stat().st_ino
+
+    state.save()
+    ProcessingState(state_file).save()
+    assert state_file.stat().st_ino == inode
+
+    state.mark_processed("doc-2", "hash-2")
+    state.save()
+    assert state_file.stat().st_ino != inode
+
+
+def test_processed_pairs_tracks_transitions(tmp_path):
+    """Test processed_pairs is cached and refreshed after state changes."""
+    state = ProcessingState(tmp_path / "state.json")
+    state.mark_processed("doc1", "hash1")
+
+    pairs = state.processed_pairs()
+    assert pairs == {("doc1", "hash1")}
+    assert state.processed_pairs() is pairs
+
+    state.mark_failed("doc1", "hash2", "boom")
+    assert state.processed_pairs() == frozenset()
+
+
+def test_malformed_state_record_raises(tmp_path):
+    """Test a schema error fails loudly instead of starting from an empty state."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text('{"processed": {"doc-1": {"at": "2024-01-01T00:00:00+00:00"}}}')
+
+    with pytest.raises(ValueError, match="Malformed pipeline state"):
+        ProcessingState(state_file)
+
+    assert "doc-1" in state_file.read_text()
+
+
+def test_corrupt_journal_line_before_others_raises(tmp_path):
+    """Test only a trailing undecodable journal line is treated as a torn write."""
+    state_file = tmp_path / "state.json"
+    state = ProcessingState(state_file)
+    state.mark_processed("doc-1", "hash-1")
+    state.close()
+
+    with open(state.journal_file, "a") as f:
+        f.write("garbage\n")
+        f.write(json.dumps({"op": "removed", "doc_id": "doc-1"}) + "\n")
+
+    with pytest.raises(ValueError, match="Corrupt entry 2"):
+        ProcessingState(state_file)
+
+    assert state.journal_file.exists()
@@ -3,7 +3,8 @@
 Tests only critical token counting functionality. TokenCounter is a thin wrapper around tiktoken.
 """
 
-from lovdata_pipeline.domain.splitters.token_counter import TokenCounter
+from lovdata_pipeline.domain.splitters import token_counter
+from lovdata_pipeline.domain.splitters.token_counter import TokenCounter, count_tokens
 
 
 def test_count_tokens():
@@ -33,3 +34,24 @@ def test_split_by_tokens():
     for chunk in chunks:
         token_count = counter.count_tokens(chunk)
         assert token_count <= max_tokens + 5  # Small tolerance for boundary cases
+
+
+def test_encoding_shared_across_instances():
+    """Test that counters reuse one encoding instead of reloading the BPE table."""
+    assert TokenCounter().encoding is TokenCounter().encoding
+
+
+def test_count_tokens_memoizes_only_short_texts():
+    """Test short texts are memoized while long texts bypass the cache."""
+    token_counter._count_tokens_memoized.cache_clear()
+    short = "Kort setning."
+    long = "ord " * 1000
+
+    assert count_tokens(short) == count_tokens(short)
+    assert count_tokens(long) > 0
+    assert token_counter._count_tokens_memoized.cache_info().currsize == 1
+
+
+def test_count_tokens_treats_special_token_markers_as_text():
+    """Test text resembling a special token is counted instead of rejected."""
+    assert count_tokens("før <|endoftext|> etter") > 3